@@ -0,0 +1,39 @@
+import time
+
+
+class TTLCache[K, V]:
+    """In-memory mapping whose entries expire `ttl_s` seconds after being set.
+
+    Once `maxsize` entries are held, the oldest entry is evicted to make room for a new one.
+    A non-positive `ttl_s` disables caching altogether.
+    """
+
+    def __init__(self, ttl_s: float, maxsize: int = 1024):
+        super().__init__()
+        self.ttl_s = ttl_s
+        self.maxsize = maxsize
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V, ttl_s: float | None = None):
+        """Set `key` to `value`, expiring after the cache's `ttl_s`, or after the given `ttl_s` if that's sooner."""
+        if ttl_s is None or ttl_s > self.ttl_s:
+            ttl_s = self.ttl_s
+        if ttl_s <= 0:
+            return
+        self._entries.pop(key, None)  # re-inserting moves the key to the back of the eviction order
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl_s, value)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
@@ -0,0 +1,61 @@
+import re
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+_MOUNTAIN_TIMEZONE = ZoneInfo("America/Denver")
+
+_CLEAN_AT = re.compile(r"\s+at\s+")
+_CLEAN_WS = re.compile(r"\s+")
+# Datetime patterns, each with the strptime formats that parse its groups once they're joined by spaces
+_DATETIME_FORMATS = [
+    (re.compile(pattern, re.IGNORECASE), formats)
+    for pattern, formats in (
+        (r"(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)", ("%B %d %Y %I %M %p", "%b %d %Y %I %M %p")),
+        (r"(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)", ("%m %d %Y %I %M %p",)),
+        (r"(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})", ("%Y %m %d %H %M",)),
+    )
+]
+
+
+# listings often repeat a date string, e.g. across a series of events
+@lru_cache(maxsize=512)
+def parse_mountain_datetime(time_text: str) -> datetime | None:
+    """Parse a date and time shown on a Utah event page, like "December 14, 2024 at 2:00 PM", as Mountain time."""
+    # Remove common words and normalize
+    cleaned = _CLEAN_AT.sub(" ", time_text)
+    cleaned = _CLEAN_WS.sub(" ", cleaned).strip()
+
+    # Try different parsing patterns
+    for pattern, formats in _DATETIME_FORMATS:
+        match = pattern.search(cleaned)
+        if not match:
+            continue
+
+        joined = " ".join(match.groups())
+        for datetime_format in formats:
+            try:
+                return datetime.strptime(joined, datetime_format).replace(tzinfo=_MOUNTAIN_TIMEZONE)
+            except ValueError:
+                continue
+
+    return None
+
+
+def parse_event_time(candidates: Iterable[str]) -> datetime | None:
+    """Parse the first of an event's candidate times that can be, each either ISO 8601 (e.g. a `datetime` attribute) or
+    shown on the page like `parse_mountain_datetime` expects.
+    """
+    for candidate in candidates:
+        try:
+            event_time = datetime.fromisoformat(candidate.strip().replace("Z", "+00:00"))
+        except ValueError:
+            pass
+        else:
+            # a bare local time on a Utah page is Mountain time
+            return event_time if event_time.tzinfo else event_time.replace(tzinfo=_MOUNTAIN_TIMEZONE)
+        shown_time = parse_mountain_datetime(candidate)
+        if shown_time is not None:
+            return shown_time
+    return None
@@ -6,6 +6,10 @@ from pydantic_settings import BaseSettings
 class _Env(BaseSettings):
     debug: bool = False
     playwright_timeout_ms: int = 15_000
+    event_details_concurrency: int = 5
+    scrape_cache_ttl_s: int = 3600
+    failed_event_cache_ttl_s: int = 600
+    page_pool_size: int = 5
     port: int = 8080
 
 
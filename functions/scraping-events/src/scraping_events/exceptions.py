@@ -8,6 +8,15 @@ class UnknownEventProviderError(Exception):
 class NavigationError(Exception):
     """Failed to navigate to the URL in question"""
 
+    def __init__(self, url: str, status: int | None = None):
+        super().__init__(url)
+        self.status = status
+        """HTTP status of the last response, if the page responded at all"""
+
+
+class PageTimeoutError(Exception):
+    """Timed out waiting for the URL in question to load, which may well succeed on a later attempt"""
+
     def __init__(self, url: str):
         super().__init__(url)
 
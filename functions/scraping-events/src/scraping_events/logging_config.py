@@ -1,6 +1,7 @@
 import logging
 import logging.config
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
 from scraping_events.env import get_env
 
@@ -11,9 +12,12 @@ _VERBOSE_LOGGERS = [
 ]
 
 
-def set_logging_config(stream: Literal["stdout", "stderr"] = "stdout"):
-    env = get_env()
-    config = {
+_applied_config: dict[str, Any] | None = None
+
+
+@lru_cache(maxsize=4)
+def _build_logging_config(stream: Literal["stdout", "stderr"], debug: bool) -> dict[str, Any]:
+    return {
         "version": 1,
         "formatters": {
             "default": {
@@ -36,7 +40,7 @@ def set_logging_config(stream: Literal["stdout", "stderr"] = "stdout"):
             },
             **{
                 _verbose_logger_name: {
-                    "level": logging.DEBUG if env.debug else logging.INFO,
+                    "level": logging.DEBUG if debug else logging.INFO,
                 }
                 for _verbose_logger_name in _VERBOSE_LOGGERS
             },
@@ -47,4 +51,13 @@ def set_logging_config(stream: Literal["stdout", "stderr"] = "stdout"):
         },
         "disable_existing_loggers": False,  # allow loggers to be instantiated before this config
     }
+
+
+def set_logging_config(stream: Literal["stdout", "stderr"] = "stdout"):
+    global _applied_config  # noqa: PLW0603
+    config = _build_logging_config(stream, get_env().debug)
+    if config is _applied_config:
+        # already in effect, so skip re-instantiating the same handlers and formatters
+        return
     logging.config.dictConfig(config)
+    _applied_config = config
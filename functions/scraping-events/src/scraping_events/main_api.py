@@ -6,9 +6,10 @@ from fastapi import Depends, FastAPI, Request, status as http_status
 from fastapi.responses import JSONResponse
 from playwright.async_api import Browser
 
+from scraping_events.env import get_env
 from scraping_events.exceptions import UnknownEventProviderError
 from scraping_events.logging_config import set_logging_config
-from scraping_events.playwright_utils import launch_browser
+from scraping_events.playwright_utils import PagePool, launch_browser
 from scraping_events.schemas import ResponseError, ScrapeEventsRequest, ScrapeEventsResponse
 from scraping_events.scrape_events import scrape_events
 
@@ -19,8 +20,9 @@ LOGGER = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(api_: FastAPI):
-    async with launch_browser() as browser:
+    async with launch_browser() as browser, PagePool.open(browser, get_env().page_pool_size) as page_pool:
         api_.state.browser = browser
+        api_.state.page_pool = page_pool
         yield
 
 
@@ -31,6 +33,13 @@ async def _browser_dep(request: Request) -> Browser:
 BrowserDep = Annotated[Browser, Depends(_browser_dep)]
 
 
+async def _page_pool_dep(request: Request) -> PagePool:
+    return request.app.state.page_pool
+
+
+PagePoolDep = Annotated[PagePool, Depends(_page_pool_dep)]
+
+
 api = FastAPI(lifespan=lifespan)
 
 
@@ -59,6 +68,6 @@ async def get_root():  # noqa: ANN201
 
 
 @api.post("/scrape-events")
-async def post_scrape_events(body: ScrapeEventsRequest, browser: BrowserDep) -> ScrapeEventsResponse:
-    events = await scrape_events(browser, body.url, body.max_events)
+async def post_scrape_events(body: ScrapeEventsRequest, browser: BrowserDep, page_pool: PagePoolDep) -> ScrapeEventsResponse:
+    events = await scrape_events(browser, body.url, body.max_events, page_pool)
     return ScrapeEventsResponse(events=events)
@@ -1,24 +1,68 @@
 import asyncio
+import dataclasses
 import logging
 import os
 import random
 import shutil
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Awaitable, Callable, Collection, Generator, Mapping, Sequence
+from contextlib import aclosing, asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
+from urllib.parse import urlparse
 
-from playwright.async_api import Browser, BrowserContext, Error as PlaywrightError, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
 
+from scraping_events.caching import TTLCache
 from scraping_events.env import get_env
-from scraping_events.exceptions import NavigationError
+from scraping_events.exceptions import NavigationError, PageTimeoutError, ParsingError
+from scraping_events.schemas import Event
 
 LOGGER = logging.getLogger(__name__)
 
 _HEADLESS = not get_env().debug
 _TRACES_DIR = Path("traces")
 
+# why each recently failed event page failed, so repeated scrapes skip it rather than rediscover the same failure;
+# timeouts, browser errors and server errors aren't remembered, since the page may well load next time
+_FAILED_EVENT_URLS: TTLCache[str, str] = TTLCache(ttl_s=get_env().failed_event_cache_ttl_s)
+# HTTP statuses saying that a page is gone for good, rather than that the server is having trouble
+_LASTING_HTTP_STATUSES = frozenset({404, 410})
+# the event pages that have failed to scrape so far within the current `track_event_failures` block, if any
+_EVENT_FAILURES: ContextVar["EventFailures | None"] = ContextVar("_EVENT_FAILURES", default=None)
+
+# downloads that never affect the DOM content we scrape (see `PageWrapper.block_requests`)
+NONESSENTIAL_RESOURCE_TYPES = frozenset({"font", "media", "stylesheet", "websocket"})
+TRACKER_URL_SUBSTRINGS = (
+    "googletagmanager",
+    "doubleclick",
+    "facebook.net",
+    "google-analytics",
+    "segment.io",
+    "sentry.io",
+    "fullstory",
+    "hotjar",
+)
+
+# For each named (selectors, reads) query, the reads (attribute value, or inner text when the read is null) of the first
+# element matching each selector, or null where a selector matches nothing, so a whole page costs one round-trip
+_SELECTOR_READS_JS = """(queries) => Object.fromEntries(Object.entries(queries).map(([name, [selectors, reads]]) => [
+    name,
+    selectors.map(selector => {
+        const element = document.querySelector(selector);
+        return element ? reads.map(read => read ? element.getAttribute(read) : element.innerText) : null;
+    }),
+]))"""
+
 
 def _chromium_executable() -> str | None:
     """Return a system chromium path if Playwright's bundled one isn't installed."""
@@ -40,12 +84,16 @@ async def launch_browser() -> AsyncGenerator[Browser]:
 
 
 @asynccontextmanager
-async def launch_browser_context(browser: Browser) -> AsyncGenerator[BrowserContext]:
+async def launch_browser_context(
+    browser: Browser, *, record_trace: bool | None = None
+) -> AsyncGenerator[BrowserContext]:
+    """Open a browser context, recording a Playwright trace if `record_trace` is set (by default, in debug mode)."""
     browser_context = await browser.new_context(timezone_id="UTC")
     try:
         env = get_env()
         browser_context.set_default_timeout(env.playwright_timeout_ms)
-        record_trace = env.debug
+        if record_trace is None:
+            record_trace = env.debug
         if record_trace:
             try:
                 await browser_context.tracing.start(snapshots=True, screenshots=True, sources=True)
@@ -84,19 +132,390 @@ class PageWrapper:
         super().__init__()
         self.page = page
 
-    async def navigate(self, url: str):
+    async def navigate(self, url: str, wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = "load"):
+        last_error: PlaywrightError | None = None
+        last_status: int | None = None
         for attempt in range(3):
             if attempt > 0:
                 await asyncio.sleep(5)
             try:
-                response = await self.page.goto(url)
-            except PlaywrightError:
+                response = await self.page.goto(url, wait_until=wait_until)
+            except PlaywrightError as e:
                 LOGGER.exception(f"Failed to navigate to {url} (attempt {attempt + 1})")
+                last_error, last_status = e, None
                 continue
             if response is not None and not response.ok:
                 LOGGER.error(f"Failed to navigate to {url} (attempt {attempt + 1}): {response.status}")
+                last_error, last_status = None, response.status
                 continue
             # success
             return
         # never got a success
-        raise NavigationError(url)
+        if isinstance(last_error, PlaywrightTimeoutError):
+            raise PageTimeoutError(url) from last_error
+        raise NavigationError(url, last_status) from last_error
+
+    async def block_requests(
+        self,
+        resource_types: Collection[str] = NONESSENTIAL_RESOURCE_TYPES,
+        url_substrings: Sequence[str] = TRACKER_URL_SUBSTRINGS,
+        *,
+        include_images: bool = False,
+    ):
+        """Abort this page's requests of the given resource types or to URLs containing any of the substrings.
+
+        Images are blocked too unless `include_images` is set; an `<img>`'s `src` can be read without downloading it.
+        All other requests are let through.
+        Scrapers that only read the DOM can use this to skip downloads that have no bearing on the extracted data.
+        """
+        if not include_images:
+            resource_types = {*resource_types, "image"}
+
+        async def _handle_route(route: Route):
+            request = route.request
+            if request.resource_type in resource_types or any(s in request.url for s in url_substrings):
+                await route.abort()
+            else:
+                await route.fallback()
+
+        await self.page.route("**/*", _handle_route)
+
+
+async def wait_for_any_selector(page: Page, selectors: Sequence[str], timeout_ms: float) -> bool:
+    """Wait for whichever of `selectors` shows up first, returning False if none do within `timeout_ms` milliseconds."""
+    waits = [asyncio.create_task(page.wait_for_selector(selector, timeout=timeout_ms)) for selector in selectors]
+    try:
+        for next_wait in asyncio.as_completed(waits):
+            try:
+                await next_wait
+            except PlaywrightTimeoutError:
+                continue
+            return True
+        return False
+    finally:
+        for wait in waits:
+            wait.cancel()
+        await asyncio.gather(*waits, return_exceptions=True)
+
+
+type ElementRead = str | None
+"""Name of the attribute to read from an element, or None for its inner text"""
+
+type SelectorQuery = tuple[Sequence[str], ElementRead | tuple[ElementRead, ...]]
+"""Selectors to try in priority order, and what to read from the first match.
+
+Given several reads, each is tried with all the selectors before the next one is, e.g. `("datetime", None)` prefers any
+matching element's datetime attribute, even one matched by a later selector, over the text of any of them.
+"""
+
+
+def _all_matches(reads_by_selector: Sequence[Sequence[str | None] | None], read_count: int) -> list[str]:
+    """List the non-blank reads in priority order: each read with every selector's element, then the next read."""
+    matches: list[str] = []
+    for read_index in range(read_count):
+        for reads in reads_by_selector:
+            if reads is None:
+                continue
+            value = reads[read_index]
+            if value and value.strip():
+                matches.append(value)
+    return matches
+
+
+async def query_all_matches(page: Page, queries: Mapping[str, SelectorQuery]) -> dict[str, list[str]]:
+    """Resolve several named selector queries against the page in a single round-trip, listing every match of each.
+
+    Each query's matches are in priority order, e.g. for a field that not every match can be parsed as.
+    """
+    reads_by_query = {
+        name: list(reads) if isinstance(reads, tuple) else [reads] for name, (_, reads) in queries.items()
+    }
+    reads_by_selector_by_query: dict[str, list[list[str | None] | None]] = await page.evaluate(
+        _SELECTOR_READS_JS,
+        {name: [list(selectors), reads_by_query[name]] for name, (selectors, _) in queries.items()},
+    )
+    return {
+        name: _all_matches(reads_by_selector, len(reads_by_query[name]))
+        for name, reads_by_selector in reads_by_selector_by_query.items()
+    }
+
+
+def first_matches(matches: Mapping[str, Sequence[str]]) -> dict[str, str | None]:
+    """Take the first of each query's matches, as returned by `query_all_matches`."""
+    return {name: query_matches[0] if query_matches else None for name, query_matches in matches.items()}
+
+
+async def query_first_matches(page: Page, queries: Mapping[str, SelectorQuery]) -> dict[str, str | None]:
+    """Resolve several named selector queries against the page in a single round-trip."""
+    return first_matches(await query_all_matches(page, queries))
+
+
+class PagePool:
+    """Up to `size` open pages in one shared browser context, lent out one scrape at a time.
+
+    Pages are opened as they're first needed and then kept for reuse. Sharing the context keeps its cookies, cache and
+    open connections warm across scrapes, and a long-lived pool lets repeated scrapes skip browser context setup
+    altogether. Pages that close or crash are dropped, and fresh ones opened in their place.
+    """
+
+    @classmethod
+    @asynccontextmanager
+    async def open(cls, browser: Browser, size: int, *, record_trace: bool = False) -> AsyncGenerator[Self]:
+        """Open a pool, which only records a Playwright trace if `record_trace` is set.
+
+        A trace covers the pool's whole life and is only saved once it closes, so it's best kept to short-lived pools.
+        """
+        # the pages close along with their context
+        async with launch_browser_context(browser, record_trace=record_trace) as browser_context:
+            yield cls(browser_context, size)
+
+    def __init__(self, browser_context: BrowserContext, size: int):
+        super().__init__()
+        self.browser_context = browser_context
+        self.size = size
+        # one per page that may be lent out at once, whether it's already open or has yet to be
+        self._slots = asyncio.Semaphore(size)
+        self._idle: asyncio.Queue[PageWrapper] = asyncio.Queue()
+        self._page_count = 0
+        self._last_hostname: str | None = None
+
+    async def _get_page(self) -> PageWrapper:
+        # called holding a slot, so there's either an idle page or room to open one
+        while not self._idle.empty():
+            page_wrapper = self._idle.get_nowait()
+            if not page_wrapper.page.is_closed():
+                return page_wrapper
+            self._page_count -= 1
+        page_wrapper = PageWrapper(await self.browser_context.new_page())
+        self._page_count += 1
+        return page_wrapper
+
+    async def _put_page(self, page_wrapper: PageWrapper):
+        """Return a borrowed page to the pool, or drop it if it's no longer usable."""
+        page = page_wrapper.page
+        reusable = False
+        try:
+            if not page.is_closed():
+                # pages go back into the pool without any request routing left behind by the borrower
+                await page.unroute_all(behavior="ignoreErrors")
+                reusable = True
+        except Exception:
+            LOGGER.exception("Failed to reset pooled page for reuse, so replacing it")
+            with suppress(PlaywrightError):
+                await page.close()
+        finally:
+            if reusable:
+                self._idle.put_nowait(page_wrapper)
+            else:
+                self._page_count -= 1
+
+    @asynccontextmanager
+    async def acquire(self, url: str) -> AsyncGenerator[PageWrapper]:
+        """Borrow an idle page for scraping `url`, waiting for one if they're all in use."""
+        async with self._slots:
+            page_wrapper = await self._get_page()
+            try:
+                hostname = urlparse(url).hostname
+                # don't carry one website's session over to another, unless other pages are still using it
+                other_pages_idle = self._idle.qsize() == self._page_count - 1
+                if self._last_hostname is not None and self._last_hostname != hostname and other_pages_idle:
+                    await self.browser_context.clear_cookies()
+                self._last_hostname = hostname
+                yield page_wrapper
+            finally:
+                await self._put_page(page_wrapper)
+
+
+@asynccontextmanager
+async def open_page(browser: Browser, url: str, page_pool: PagePool | None = None) -> AsyncGenerator[PageWrapper]:
+    """Borrow a page from `page_pool` for scraping `url`, or open a fresh one if there's no pool."""
+    if page_pool is None:
+        async with PageWrapper.open(browser) as page_wrapper:
+            yield page_wrapper
+    else:
+        async with page_pool.acquire(url) as page_wrapper:
+            yield page_wrapper
+
+
+@asynccontextmanager
+async def ensure_page_pool(browser: Browser, page_pool: PagePool | None = None) -> AsyncGenerator[PagePool]:
+    """Yield `page_pool`, or if there's none, a temporary pool for the duration of one scrape.
+
+    In debug mode, the temporary pool records a Playwright trace of the scrape.
+
+    Scrapers get their listing page from the same pool (and so browser context) as their event pages, which can then
+    reuse the listing's connections.
+    """
+    if page_pool is not None:
+        yield page_pool
+    else:
+        env = get_env()
+        async with PagePool.open(browser, env.event_details_concurrency, record_trace=env.debug) as temp_page_pool:
+            yield temp_page_pool
+
+
+@dataclasses.dataclass
+class EventFailures:
+    """The event pages left out of a scrape, as collected by `track_event_failures`."""
+    failed: list[str] = dataclasses.field(default_factory=list)
+    """Event pages that failed to scrape"""
+    skipped: list[str] = dataclasses.field(default_factory=list)
+    """Event pages that weren't scraped at all, for having failed recently"""
+
+
+@contextmanager
+def track_event_failures() -> Generator[EventFailures]:
+    """Collect the URLs of the event pages left out of scrapes within the block, e.g. to tell whether its events are
+    complete.
+    """
+    failures = EventFailures()
+    token = _EVENT_FAILURES.set(failures)
+    try:
+        yield failures
+    finally:
+        _EVENT_FAILURES.reset(token)
+
+
+def _is_lasting_failure(error: Exception) -> bool:
+    """Whether an event page's scrape failed in a way that's likely to recur, rather than because of a passing problem.
+
+    Navigation only fails for good on a missing page (e.g. a 404), not on a browser error or a server error. Scrapers
+    wrap whatever goes wrong while reading a page in a ParsingError, so one caused by a Playwright error (e.g. a closed
+    page) doesn't count either.
+    """
+    if isinstance(error, NavigationError):
+        return error.status in _LASTING_HTTP_STATUSES
+    return isinstance(error, ParsingError) and not isinstance(error.__cause__, PlaywrightError)
+
+
+async def _scrape_event_pages_as_completed(
+    browser: Browser,
+    event_urls: Sequence[str],
+    get_event_details: Callable[[PageWrapper, str], Awaitable[Event]],
+    page_pool: PagePool | None = None,
+) -> AsyncGenerator[tuple[int, Event]]:
+    """Scrape event detail pages concurrently, yielding each event with its index in `event_urls` as soon as it's done.
+
+    Events that fail to scrape are logged and left out. Those that are missing or couldn't be parsed are also skipped by
+    later scrapes for a while, unlike those that merely timed out or ran into a browser or server error.
+    """
+    indexes_to_scrape: list[int] = []
+    for index, event_url in enumerate(event_urls):
+        recent_failure = _FAILED_EVENT_URLS.get(event_url)
+        if recent_failure is None:
+            indexes_to_scrape.append(index)
+        else:
+            LOGGER.info(f"Skipping event {event_url}, which recently failed to scrape ({recent_failure})")
+            if (failures := _EVENT_FAILURES.get()) is not None:
+                failures.skipped.append(event_url)
+    if not indexes_to_scrape:
+        return
+
+    async with ensure_page_pool(browser, page_pool) as pool:
+
+        async def _scrape_event_page(event_url: str) -> Event:
+            async with pool.acquire(event_url) as page_wrapper:
+                return await get_event_details(page_wrapper, event_url)
+
+        # keyed as futures, which is what `asyncio.as_completed` hands the tasks back as
+        indexes_by_task: dict[asyncio.Future[Event], int] = {
+            asyncio.create_task(_scrape_event_page(event_urls[index])): index for index in indexes_to_scrape
+        }
+        try:
+            async for task in asyncio.as_completed(indexes_by_task):
+                index = indexes_by_task[task]
+                event_url = event_urls[index]
+                try:
+                    event = await task
+                except Exception as e:
+                    LOGGER.error(f"Failed to scrape event {event_url}: {e}")
+                    if (failures := _EVENT_FAILURES.get()) is not None:
+                        failures.failed.append(event_url)
+                    if _is_lasting_failure(e):
+                        _FAILED_EVENT_URLS.set(event_url, f"{type(e).__name__}: {e}")
+                    continue
+                yield index, event
+        finally:
+            # whatever's left over if the caller stops early
+            for task in indexes_by_task:
+                task.cancel()
+            await asyncio.gather(*indexes_by_task, return_exceptions=True)
+
+
+async def iter_event_pages(
+    browser: Browser,
+    event_urls: Sequence[str],
+    get_event_details: Callable[[PageWrapper, str], Awaitable[Event]],
+    page_pool: PagePool | None = None,
+) -> AsyncGenerator[Event]:
+    """Scrape event detail pages concurrently, sharing the pages of `page_pool` between them.
+
+    Events are yielded in the order they finish scraping, so the first is ready as soon as the fastest page is.
+    Without a pool, a temporary one is opened for the duration of the scrape.
+    Events that fail to scrape are logged and left out. Those that are missing or couldn't be parsed are also skipped by
+    later scrapes for a while, unlike those that merely timed out or ran into a browser or server error.
+    """
+    # so the scrapes still running are cancelled as soon as the caller stops early, not whenever this is collected
+    async with aclosing(
+        _scrape_event_pages_as_completed(browser, event_urls, get_event_details, page_pool)
+    ) as indexed_events:
+        async for _, event in indexed_events:
+            yield event
+
+
+async def scrape_event_pages(
+    browser: Browser,
+    event_urls: Sequence[str],
+    get_event_details: Callable[[PageWrapper, str], Awaitable[Event]],
+    page_pool: PagePool | None = None,
+) -> list[Event]:
+    """Scrape event detail pages concurrently, like `iter_event_pages`, returning the events all at once.
+
+    Unlike `iter_event_pages`, the events are in the order of `event_urls`.
+    """
+    indexed_events = [
+        indexed_event
+        async for indexed_event in _scrape_event_pages_as_completed(browser, event_urls, get_event_details, page_pool)
+    ]
+    indexed_events.sort(key=lambda indexed_event: indexed_event[0])
+    return [event for _, event in indexed_events]
+
+
+async def _get_listed_event_urls(
+    pool: PagePool,
+    url: str,
+    max_events: int,
+    get_upcoming_event_urls: Callable[[PageWrapper, str, int], Awaitable[list[str]]],
+) -> list[str]:
+    async with pool.acquire(url) as page_wrapper:
+        return await get_upcoming_event_urls(page_wrapper, url, max_events)
+
+
+async def iter_listed_events(
+    browser: Browser,
+    url: str,
+    max_events: int,
+    get_upcoming_event_urls: Callable[[PageWrapper, str, int], Awaitable[list[str]]],
+    get_event_details: Callable[[PageWrapper, str], Awaitable[Event]],
+    page_pool: PagePool | None = None,
+) -> AsyncGenerator[Event]:
+    """Scrape the event pages linked from the listing page at `url`, yielding them like `iter_event_pages`."""
+    async with ensure_page_pool(browser, page_pool) as pool:
+        event_urls = await _get_listed_event_urls(pool, url, max_events, get_upcoming_event_urls)
+        async with aclosing(iter_event_pages(browser, event_urls, get_event_details, pool)) as events:
+            async for event in events:
+                yield event
+
+
+async def scrape_listed_events(
+    browser: Browser,
+    url: str,
+    max_events: int,
+    get_upcoming_event_urls: Callable[[PageWrapper, str, int], Awaitable[list[str]]],
+    get_event_details: Callable[[PageWrapper, str], Awaitable[Event]],
+    page_pool: PagePool | None = None,
+) -> list[Event]:
+    """Scrape the event pages linked from the listing page at `url`, returning them like `scrape_event_pages`."""
+    async with ensure_page_pool(browser, page_pool) as pool:
+        event_urls = await _get_listed_event_urls(pool, url, max_events, get_upcoming_event_urls)
+        return await scrape_event_pages(browser, event_urls, get_event_details, pool)
@@ -1,19 +1,75 @@
 import logging
 import re
 from datetime import datetime
-from urllib.parse import ParseResult as ParsedUrl
 from typing import Optional
+from urllib.parse import ParseResult as ParsedUrl
 
 from playwright.async_api import Browser, TimeoutError as PlaywrightTimeoutError
 
-from scraping_events.exceptions import ParsingError
-from scraping_events.playwright_utils import PageWrapper
+from scraping_events.exceptions import PageTimeoutError, ParsingError
+from scraping_events.playwright_utils import (
+    PagePool,
+    PageWrapper,
+    query_first_matches,
+    scrape_listed_events,
+)
 from scraping_events.schemas import Event
 
 LOGGER = logging.getLogger(__name__)
 
 BYU_CS_EVENTS_URL = "https://cs.byu.edu/events/"
 
+_HREFS_JS = "els => els.map(e => e.getAttribute('href'))"
+
+_TITLE_SELECTORS = [
+    'h1.event-title',
+    'h1',
+    '.event-header h1',
+    '.page-title'
+]
+
+_DESC_SELECTORS = [
+    '.event-description',
+    '.event-content',
+    '.content',
+    'main p',
+    '.event-details'
+]
+
+_TIME_SELECTORS = [
+    '.event-date',
+    '.event-time', 
+    '.date-time',
+    'time[datetime]',
+    '.event-meta .date'
+]
+
+_LOCATION_SELECTORS = [
+    '.event-location',
+    '.location',
+    '.venue',
+    '.event-meta .location'
+]
+
+_IMG_SELECTORS = [
+    '.event-image img',
+    '.hero-image img',
+    'main img'
+]
+
+_ONLINE_RE = re.compile(r'online|virtual|zoom|teams', re.IGNORECASE)
+
+_CLEAN_AT = re.compile(r'\s+at\s+')
+_CLEAN_WS = re.compile(r'\s+')
+_BYU_DATETIME_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
+        r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
+        r'(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})',
+    )
+]
+
 
 def is_byu_cs_url(url_parsed: ParsedUrl) -> bool:
     """Check if URL is BYU CS department events page."""
@@ -23,18 +79,20 @@ def is_byu_cs_url(url_parsed: ParsedUrl) -> bool:
 async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str, max_events: int) -> list[str]:
     """Get upcoming event URLs from BYU CS events page."""
     LOGGER.info(f"Looking for upcoming events on BYU CS page: {starting_url}")
-    await page_wrapper.navigate(starting_url)
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(starting_url, wait_until='domcontentloaded')
     page = page_wrapper.page
     
     # Wait for the page to load
     try:
-        await page.wait_for_selector('.event-item, .event-card, .event', timeout=10000)
+        await page.wait_for_selector('.event-item, .event-card, .event', timeout=5000)
     except PlaywrightTimeoutError:
         LOGGER.info(f"No events found on {starting_url}")
         return []
     
     # Find all event links
     event_urls: list[str] = []
+    seen_event_urls: set[str] = set()
     
     # Try different selectors that might be used for event listings
     selectors = [
@@ -47,29 +105,27 @@ async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str,
     
     for selector in selectors:
         try:
-            event_links = page.locator(selector)
-            count = await event_links.count()
+            # Grab every href in one round-trip rather than one per link
+            hrefs: list[str | None] = await page.eval_on_selector_all(selector, _HREFS_JS)
             
-            if count > 0:
-                LOGGER.info(f"Found {count} event links using selector: {selector}")
+            if hrefs:
+                LOGGER.info(f"Found {len(hrefs)} event links using selector: {selector}")
                 
-                for i in range(min(count, max_events)):
-                    try:
-                        event_url = await event_links.nth(i).get_attribute('href')
-                        if event_url:
-                            # Ensure full URL
-                            if event_url.startswith('/'):
-                                event_url = f"https://cs.byu.edu{event_url}"
-                            elif not event_url.startswith('http'):
-                                event_url = f"https://cs.byu.edu/events/{event_url}"
-                            
-                            # Only include event URLs, not navigation links
-                            if '/events/' in event_url and event_url not in event_urls:
-                                event_urls.append(event_url)
-                                LOGGER.info(f"Found event URL: {event_url}")
-                    except Exception as e:
-                        LOGGER.warning(f"Error extracting URL from event link {i}: {e}")
-                        continue
+                for href in hrefs[:max_events]:
+                    if href:
+                        # Ensure full URL
+                        if href.startswith('/'):
+                            event_url = f"https://cs.byu.edu{href}"
+                        elif not href.startswith('http'):
+                            event_url = f"https://cs.byu.edu/events/{href}"
+                        else:
+                            event_url = href
+                        
+                        # Only include event URLs, not navigation links
+                        if '/events/' in event_url and event_url not in seen_event_urls:
+                            seen_event_urls.add(event_url)
+                            event_urls.append(event_url)
+                            LOGGER.info(f"Found event URL: {event_url}")
                 
                 if event_urls:  # If we found events with this selector, use them
                     break
@@ -85,85 +141,44 @@ async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str,
 async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event:
     """Extract event details from a BYU CS event page."""
     LOGGER.info(f"Getting details for BYU CS event: {event_url}")
-    await page_wrapper.navigate(event_url)
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(event_url, wait_until='domcontentloaded')
     page = page_wrapper.page
     
-    # Wait for page to load
-    await page.wait_for_load_state('networkidle')
+    # Wait for the title rather than for the whole page, whose scripts and third-party assets can take seconds
+    try:
+        await page.wait_for_selector(', '.join(_TITLE_SELECTORS), timeout=8000)
+    except PlaywrightTimeoutError:
+        raise PageTimeoutError(event_url)
     
     try:
-        # Title - try multiple selectors
-        title_selectors = [
-            'h1.event-title',
-            'h1',
-            '.event-header h1',
-            '.page-title'
-        ]
-        
-        event_title = None
-        for selector in title_selectors:
-            try:
-                event_title = await page.locator(selector).first.inner_text()
-                if event_title and event_title.strip():
-                    break
-            except Exception:
-                continue
+        fields = await query_first_matches(page, {
+            'title': (_TITLE_SELECTORS, None),
+            'description': (_DESC_SELECTORS, None),
+            'time': (_TIME_SELECTORS, ('datetime', None)),
+            'location': (_LOCATION_SELECTORS, None),
+            'image_url': (_IMG_SELECTORS, 'src'),
+        })
         
+        # Title
+        event_title = fields['title']
         if not event_title:
             raise ParsingError(f"Could not find event title for {event_url}")
         
         event_title = event_title.strip()
         
         # Description
-        description = ""
-        desc_selectors = [
-            '.event-description',
-            '.event-content',
-            '.content',
-            'main p',
-            '.event-details'
-        ]
-        
-        for selector in desc_selectors:
-            try:
-                description = await page.locator(selector).first.inner_text()
-                if description and description.strip():
-                    break
-            except Exception:
-                continue
-        
+        description = fields['description']
         description = description.strip() if description else ""
         
         # Date and time
         event_time = None
-        time_selectors = [
-            '.event-date',
-            '.event-time', 
-            '.date-time',
-            'time[datetime]',
-            '.event-meta .date'
-        ]
-        
-        for selector in time_selectors:
+        time_value = fields['time']
+        if time_value:
             try:
-                time_elem = page.locator(selector).first
-                
-                # Try to get datetime attribute first
-                datetime_str = await time_elem.get_attribute('datetime')
-                if datetime_str:
-                    event_time = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                    break
-                
-                # If no datetime attribute, try to parse text content
-                time_text = await time_elem.inner_text()
-                if time_text:
-                    event_time = _parse_byu_datetime(time_text)
-                    if event_time:
-                        break
-                        
-            except Exception as e:
-                LOGGER.warning(f"Error parsing time with selector {selector}: {e}")
-                continue
+                event_time = datetime.fromisoformat(time_value.replace('Z', '+00:00'))
+            except ValueError:
+                event_time = _parse_byu_datetime(time_value)
         
         if not event_time:
             LOGGER.warning(f"Could not parse event time for {event_url}")
@@ -173,33 +188,17 @@ async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event
         venue_address = None
         venue_url = None
         
-        location_selectors = [
-            '.event-location',
-            '.location',
-            '.venue',
-            '.event-meta .location'
-        ]
-        
-        for selector in location_selectors:
-            try:
-                location_elem = page.locator(selector).first
-                location_text = await location_elem.inner_text()
-                
-                if location_text and location_text.strip():
-                    location_text = location_text.strip()
-                    
-                    # Check if it's an online event
-                    if any(keyword in location_text.lower() for keyword in ['online', 'virtual', 'zoom', 'teams']):
-                        venue_name = location_text
-                    else:
-                        # Most BYU events are on campus
-                        venue_name = location_text
-                        venue_address = f"{location_text}, Brigham Young University, Provo, UT"
-                    break
-                    
-            except Exception as e:
-                LOGGER.warning(f"Error parsing location with selector {selector}: {e}")
-                continue
+        location_text = fields['location']
+        if location_text:
+            location_text = location_text.strip()
+            
+            # Check if it's an online event
+            if _ONLINE_RE.search(location_text):
+                venue_name = location_text
+            else:
+                # Most BYU events are on campus
+                venue_name = location_text
+                venue_address = f"{location_text}, Brigham Young University, Provo, UT"
         
         # If no specific location found, assume it's on BYU campus
         if not venue_name and not venue_address:
@@ -207,23 +206,10 @@ async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event
             venue_address = "Brigham Young University, Provo, UT 84602"
         
         # Image
-        image_url = None
-        img_selectors = [
-            '.event-image img',
-            '.hero-image img',
-            'main img'
-        ]
-        
-        for selector in img_selectors:
-            try:
-                image_url = await page.locator(selector).first.get_attribute('src')
-                if image_url:
-                    # Ensure full URL
-                    if image_url.startswith('/'):
-                        image_url = f"https://cs.byu.edu{image_url}"
-                    break
-            except Exception:
-                continue
+        image_url = fields['image_url']
+        # Ensure full URL
+        if image_url and image_url.startswith('/'):
+            image_url = f"https://cs.byu.edu{image_url}"
         
         return Event(
             url=event_url,
@@ -248,18 +234,12 @@ def _parse_byu_datetime(time_text: str) -> Optional[datetime]:
         # This is a simplified parser - might need refinement based on actual format
         
         # Remove common words and normalize
-        cleaned = re.sub(r'\s+at\s+', ' ', time_text)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _CLEAN_AT.sub(' ', time_text)
+        cleaned = _CLEAN_WS.sub(' ', cleaned).strip()
         
         # Try different parsing patterns
-        patterns = [
-            r'(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-            r'(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, cleaned, re.IGNORECASE)
+        for pattern in _BYU_DATETIME_PATTERNS:
+            match = pattern.search(cleaned)
             if match:
                 # This would need proper date parsing logic
                 # For now, return None to avoid errors
@@ -273,18 +253,6 @@ def _parse_byu_datetime(time_text: str) -> Optional[datetime]:
         return None
 
 
-async def scrape_byu_cs(browser: Browser, url: str, max_events: int) -> list[Event]:
+async def scrape_byu_cs(browser: Browser, url: str, max_events: int, page_pool: PagePool | None = None) -> list[Event]:
     """Scrape events from BYU CS department events page."""
-    async with PageWrapper.open(browser) as page_wrapper:
-        event_urls = await _get_upcoming_event_urls(page_wrapper, url, max_events)
-        events: list[Event] = []
-        
-        for event_url in event_urls:
-            try:
-                event = await _get_event_details(page_wrapper, event_url)
-                events.append(event)
-            except Exception as e:
-                LOGGER.error(f"Failed to scrape event {event_url}: {e}")
-                continue
-        
-        return events
\ No newline at end of file
+    return await scrape_listed_events(browser, url, max_events, _get_upcoming_event_urls, _get_event_details, page_pool)
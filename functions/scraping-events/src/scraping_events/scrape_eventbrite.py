@@ -1,42 +1,92 @@
 import logging
 import re
 from datetime import datetime
-from urllib.parse import ParseResult as ParsedUrl
 from typing import Optional
+from urllib.parse import ParseResult as ParsedUrl
 
 from playwright.async_api import Browser, TimeoutError as PlaywrightTimeoutError
 
-from scraping_events.exceptions import ParsingError
-from scraping_events.playwright_utils import PageWrapper
+from scraping_events.exceptions import PageTimeoutError, ParsingError
+from scraping_events.playwright_utils import (
+    PagePool,
+    PageWrapper,
+    query_first_matches,
+    scrape_listed_events,
+    wait_for_any_selector,
+)
 from scraping_events.schemas import Event
 
 LOGGER = logging.getLogger(__name__)
 
+_EVENTBRITE_HOSTNAME_SUFFIXES = ("eventbrite.com", "eventbrite.ca", "eventbrite.co.uk")
+
+_HREFS_JS = "els => els.map(e => e.getAttribute('href'))"
+
+_TITLE_SELECTORS = [
+    '[data-testid="event-title"]',
+    'h1.event-title',
+    'h1[data-automation="event-title"]',
+    '.event-details h1'
+]
+
+_DESC_SELECTORS = [
+    '[data-testid="event-description"]',
+    '.event-description',
+    '.event-details .description'
+]
+
+_TIME_SELECTORS = [
+    '[data-testid="event-datetime"]',
+    '.event-date-time',
+    '.event-details time[datetime]'
+]
+
+_LOCATION_SELECTORS = [
+    '[data-testid="event-location"]',
+    '.event-location',
+    '.venue-details'
+]
+
+_IMG_SELECTORS = [
+    '[data-testid="event-image"] img',
+    '.event-hero-image img',
+    '.event-details img[src*="eventbrite"]'
+]
+
+_ONLINE_RE = re.compile(r'online event|virtual|livestream', re.IGNORECASE)
+
+_CLEAN_AT = re.compile(r'\s+at\s+')
+_CLEAN_WS = re.compile(r'\s+')
+_EVENTBRITE_DATETIME_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(\w{3}),?\s+(\w{3})\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
+        r'(\w{3})\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
+        r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
+    )
+]
+
 
 def is_eventbrite_url(url_parsed: ParsedUrl) -> bool:
     """Check if URL is an Eventbrite organizer or event URL."""
     hostname = url_parsed.hostname
     if hostname is None:
         return False
-    return re.fullmatch(r".*\.?eventbrite\.(com|ca|co\.uk)", hostname, flags=re.IGNORECASE) is not None
+    return hostname.lower().endswith(_EVENTBRITE_HOSTNAME_SUFFIXES)
 
 
 async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str, max_events: int) -> list[str]:
     """Get upcoming event URLs from an Eventbrite organizer page."""
     LOGGER.info(f"Looking for upcoming events on Eventbrite page: {starting_url}")
-    await page_wrapper.navigate(starting_url)
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(starting_url, wait_until='domcontentloaded')
     page = page_wrapper.page
     
-    # Wait for the page to load
-    try:
-        await page.wait_for_selector('[data-testid="organizer-profile-events"]', timeout=10000)
-    except PlaywrightTimeoutError:
-        # Try alternative selectors for event listings
-        try:
-            await page.wait_for_selector('.event-card', timeout=5000)
-        except PlaywrightTimeoutError:
-            LOGGER.info(f"No events found on {starting_url}")
-            return []
+    # Wait for the page to load, accepting either layout of event listings
+    listing_selectors = ['[data-testid="organizer-profile-events"]', '.event-card']
+    if not await wait_for_any_selector(page, listing_selectors, timeout_ms=5000):
+        LOGGER.info(f"No events found on {starting_url}")
+        return []
     
     # Find all event cards/links
     event_urls: list[str] = []
@@ -50,24 +100,21 @@ async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str,
     
     for selector in selectors:
         try:
-            event_links = page.locator(selector)
-            count = await event_links.count()
+            # Grab every href in one round-trip rather than one per link
+            hrefs: list[str | None] = await page.eval_on_selector_all(selector, _HREFS_JS)
             
-            if count > 0:
-                LOGGER.info(f"Found {count} event links using selector: {selector}")
+            if hrefs:
+                LOGGER.info(f"Found {len(hrefs)} event links using selector: {selector}")
                 
-                for i in range(min(count, max_events)):
-                    try:
-                        event_url = await event_links.nth(i).get_attribute('href')
-                        if event_url:
-                            # Ensure full URL
-                            if event_url.startswith('/'):
-                                event_url = f"https://www.eventbrite.com{event_url}"
-                            event_urls.append(event_url)
-                            LOGGER.info(f"Found event URL: {event_url}")
-                    except Exception as e:
-                        LOGGER.warning(f"Error extracting URL from event link {i}: {e}")
-                        continue
+                for href in hrefs[:max_events]:
+                    if href:
+                        # Ensure full URL
+                        if href.startswith('/'):
+                            event_url = f"https://www.eventbrite.com{href}"
+                        else:
+                            event_url = href
+                        event_urls.append(event_url)
+                        LOGGER.info(f"Found event URL: {event_url}")
                 
                 if event_urls:  # If we found events with this selector, use them
                     break
@@ -83,81 +130,44 @@ async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str,
 async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event:
     """Extract event details from an Eventbrite event page."""
     LOGGER.info(f"Getting details for Eventbrite event: {event_url}")
-    await page_wrapper.navigate(event_url)
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(event_url, wait_until='domcontentloaded')
     page = page_wrapper.page
     
-    # Wait for page to load
-    await page.wait_for_load_state('networkidle')
+    # Wait for the title rather than for the whole page, whose scripts and third-party assets can take seconds
+    try:
+        await page.wait_for_selector(', '.join(_TITLE_SELECTORS), timeout=8000)
+    except PlaywrightTimeoutError:
+        raise PageTimeoutError(event_url)
     
     try:
-        # Title
-        title_selectors = [
-            '[data-testid="event-title"]',
-            'h1.event-title',
-            'h1[data-automation="event-title"]',
-            '.event-details h1'
-        ]
-        
-        event_title = None
-        for selector in title_selectors:
-            try:
-                event_title = await page.locator(selector).first.inner_text()
-                if event_title:
-                    break
-            except Exception:
-                continue
+        fields = await query_first_matches(page, {
+            'title': (_TITLE_SELECTORS, None),
+            'description': (_DESC_SELECTORS, None),
+            'time': (_TIME_SELECTORS, ('datetime', None)),
+            'location': (_LOCATION_SELECTORS, None),
+            'image_url': (_IMG_SELECTORS, 'src'),
+        })
         
+        # Title
+        event_title = fields['title']
         if not event_title:
             raise ParsingError(f"Could not find event title for {event_url}")
         
         event_title = event_title.strip()
         
         # Description
-        description = ""
-        desc_selectors = [
-            '[data-testid="event-description"]',
-            '.event-description',
-            '.event-details .description'
-        ]
-        
-        for selector in desc_selectors:
-            try:
-                description = await page.locator(selector).first.inner_text()
-                if description:
-                    break
-            except Exception:
-                continue
-        
+        description = fields['description']
         description = description.strip() if description else ""
         
         # Date and time
         event_time = None
-        time_selectors = [
-            '[data-testid="event-datetime"]',
-            '.event-date-time',
-            '.event-details time[datetime]'
-        ]
-        
-        for selector in time_selectors:
+        time_value = fields['time']
+        if time_value:
             try:
-                time_elem = page.locator(selector).first
-                
-                # Try to get datetime attribute first
-                datetime_str = await time_elem.get_attribute('datetime')
-                if datetime_str:
-                    event_time = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                    break
-                
-                # If no datetime attribute, try to parse text content
-                time_text = await time_elem.inner_text()
-                if time_text:
-                    event_time = _parse_eventbrite_datetime(time_text)
-                    if event_time:
-                        break
-                        
-            except Exception as e:
-                LOGGER.warning(f"Error parsing time with selector {selector}: {e}")
-                continue
+                event_time = datetime.fromisoformat(time_value.replace('Z', '+00:00'))
+            except ValueError:
+                event_time = _parse_eventbrite_datetime(time_value)
         
         if not event_time:
             LOGGER.warning(f"Could not parse event time for {event_url}")
@@ -167,52 +177,24 @@ async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event
         venue_address = None
         venue_url = None
         
-        location_selectors = [
-            '[data-testid="event-location"]',
-            '.event-location',
-            '.venue-details'
-        ]
-        
-        for selector in location_selectors:
-            try:
-                location_elem = page.locator(selector).first
-                location_text = await location_elem.inner_text()
-                
-                if location_text and location_text.strip():
-                    location_text = location_text.strip()
-                    
-                    # Check if it's an online event
-                    if any(keyword in location_text.lower() for keyword in ['online event', 'virtual', 'livestream']):
-                        venue_name = location_text
-                    else:
-                        # Try to separate venue name from address
-                        lines = location_text.split('\n')
-                        if len(lines) >= 2:
-                            venue_name = lines[0].strip()
-                            venue_address = ' '.join(lines[1:]).strip()
-                        else:
-                            venue_address = location_text
-                    break
-                    
-            except Exception as e:
-                LOGGER.warning(f"Error parsing location with selector {selector}: {e}")
-                continue
+        location_text = fields['location']
+        if location_text:
+            location_text = location_text.strip()
+            
+            # Check if it's an online event
+            if _ONLINE_RE.search(location_text):
+                venue_name = location_text
+            else:
+                # Try to separate venue name from address
+                lines = location_text.split('\n')
+                if len(lines) >= 2:
+                    venue_name = lines[0].strip()
+                    venue_address = ' '.join(lines[1:]).strip()
+                else:
+                    venue_address = location_text
         
         # Image
-        image_url = None
-        img_selectors = [
-            '[data-testid="event-image"] img',
-            '.event-hero-image img',
-            '.event-details img[src*="eventbrite"]'
-        ]
-        
-        for selector in img_selectors:
-            try:
-                image_url = await page.locator(selector).first.get_attribute('src')
-                if image_url:
-                    break
-            except Exception:
-                continue
+        image_url = fields['image_url']
         
         return Event(
             url=event_url,
@@ -237,18 +219,12 @@ def _parse_eventbrite_datetime(time_text: str) -> Optional[datetime]:
         # This is a simplified parser - might need refinement based on actual format
         
         # Remove common words and normalize
-        cleaned = re.sub(r'\s+at\s+', ' ', time_text)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _CLEAN_AT.sub(' ', time_text)
+        cleaned = _CLEAN_WS.sub(' ', cleaned).strip()
         
         # Try different parsing patterns
-        patterns = [
-            r'(\w{3}),?\s+(\w{3})\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-            r'(\w{3})\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, cleaned, re.IGNORECASE)
+        for pattern in _EVENTBRITE_DATETIME_PATTERNS:
+            match = pattern.search(cleaned)
             if match:
                 # This would need proper date parsing logic
                 # For now, return None to avoid errors
@@ -262,18 +238,6 @@ def _parse_eventbrite_datetime(time_text: str) -> Optional[datetime]:
         return None
 
 
-async def scrape_eventbrite(browser: Browser, url: str, max_events: int) -> list[Event]:
+async def scrape_eventbrite(browser: Browser, url: str, max_events: int, page_pool: PagePool | None = None) -> list[Event]:
     """Scrape events from an Eventbrite organizer page."""
-    async with PageWrapper.open(browser) as page_wrapper:
-        event_urls = await _get_upcoming_event_urls(page_wrapper, url, max_events)
-        events: list[Event] = []
-        
-        for event_url in event_urls:
-            try:
-                event = await _get_event_details(page_wrapper, event_url)
-                events.append(event)
-            except Exception as e:
-                LOGGER.error(f"Failed to scrape event {event_url}: {e}")
-                continue
-        
-        return events
\ No newline at end of file
+    return await scrape_listed_events(browser, url, max_events, _get_upcoming_event_urls, _get_event_details, page_pool)
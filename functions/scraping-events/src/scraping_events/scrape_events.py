@@ -1,27 +1,37 @@
+import asyncio
 import dataclasses
 import logging
+import weakref
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from urllib.parse import ParseResult as ParsedUrl, urlparse
 
 from playwright.async_api import Browser
 
+from scraping_events.caching import TTLCache
+from scraping_events.env import get_env
 from scraping_events.exceptions import UnknownEventProviderError
+from scraping_events.playwright_utils import PagePool, track_event_failures
 from scraping_events.schemas import Event
-from scraping_events.scrape_meetup import is_meetup_url, scrape_meetup
-from scraping_events.scrape_luma import is_luma_url, scrape_luma
-from scraping_events.scrape_eventbrite import is_eventbrite_url, scrape_eventbrite
 from scraping_events.scrape_byu_cs import is_byu_cs_url, scrape_byu_cs
-from scraping_events.scrape_utah_cs import is_utah_cs_url, scrape_utah_cs
+from scraping_events.scrape_eventbrite import is_eventbrite_url, scrape_eventbrite
+from scraping_events.scrape_luma import is_luma_url, scrape_luma
+from scraping_events.scrape_meetup import is_meetup_url, scrape_meetup
 from scraping_events.scrape_misc_websites import is_misc_website_url, scrape_misc_website
+from scraping_events.scrape_utah_cs import is_utah_cs_url, scrape_utah_cs_list
 
 LOGGER = logging.getLogger(__name__)
 
+type ScrapeFunc = Callable[[Browser, str, int, PagePool | None], Awaitable[list[Event]]]
+
 
 @dataclasses.dataclass
 class EventProvider:
     name: str
     identifier: Callable[[ParsedUrl], bool]
-    scrape_func: Callable[[Browser, str, int], Awaitable[list[Event]]]
+    scrape_func: ScrapeFunc
+    hostname_suffixes: tuple[str, ...] | None = None
+    """Hostnames this provider serves, including their subdomains; None to only go by `identifier`"""
 
 
 EVENT_PROVIDERS: list[EventProvider] = [
@@ -29,26 +39,31 @@ EVENT_PROVIDERS: list[EventProvider] = [
         name="Meetup.com",
         identifier=is_meetup_url,
         scrape_func=scrape_meetup,
+        hostname_suffixes=("meetup.com",),
     ),
     EventProvider(
         name="Luma Events",
         identifier=is_luma_url,
         scrape_func=scrape_luma,
+        hostname_suffixes=("lu.ma", "luma.com"),
     ),
     EventProvider(
         name="Eventbrite",
         identifier=is_eventbrite_url,
         scrape_func=scrape_eventbrite,
+        hostname_suffixes=("eventbrite.com", "eventbrite.ca", "eventbrite.co.uk"),
     ),
     EventProvider(
         name="BYU CS Department",
         identifier=is_byu_cs_url,
         scrape_func=scrape_byu_cs,
+        hostname_suffixes=("cs.byu.edu",),
     ),
     EventProvider(
         name="University of Utah CS",
         identifier=is_utah_cs_url,
-        scrape_func=scrape_utah_cs,
+        scrape_func=scrape_utah_cs_list,
+        hostname_suffixes=("cs.utah.edu",),
     ),
     EventProvider(
         name="Misc Websites",
@@ -57,15 +72,75 @@ EVENT_PROVIDERS: list[EventProvider] = [
     )
 ]
 
+_EVENT_PROVIDERS_BY_HOSTNAME_SUFFIX: dict[str, EventProvider] = {
+    hostname_suffix: event_provider
+    for event_provider in EVENT_PROVIDERS
+    for hostname_suffix in event_provider.hostname_suffixes or ()
+}
 
-async def scrape_events(browser: Browser, url: str, max_events: int) -> list[Event]:
-    LOGGER.info(f"Processing URL: {url}")
-    url_parsed = urlparse(url, allow_fragments=False)
+# scraped events by (url, max_events), so repeated runs within the TTL skip the browser altogether
+_SCRAPED_EVENTS_CACHE: TTLCache[tuple[str, int], list[Event]] = TTLCache(ttl_s=get_env().scrape_cache_ttl_s)
+# held while scraping a given (url, max_events), so concurrent requests for it share a single scrape
+_SCRAPE_LOCKS: weakref.WeakValueDictionary[tuple[str, int], asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(url: str) -> ParsedUrl:
+    return urlparse(url, allow_fragments=False)
+
+
+# keyed on the whole parsed URL, not just the hostname, since some identifiers also check the path
+@lru_cache(maxsize=1024)
+def _find_event_provider(url_parsed: ParsedUrl) -> EventProvider | None:
+    hostname = url_parsed.hostname or ""
+    # look up the hostname and each of its parent domains (a.b.c -> b.c -> c)
+    hostname_labels = hostname.split(".")
+    for i in range(len(hostname_labels)):
+        event_provider = _EVENT_PROVIDERS_BY_HOSTNAME_SUFFIX.get(".".join(hostname_labels[i:]))
+        if event_provider is not None and event_provider.identifier(url_parsed):
+            return event_provider
+    # not recognized by hostname, so ask each provider that could still plausibly claim it
     for event_provider in EVENT_PROVIDERS:
+        if event_provider.hostname_suffixes is not None and not hostname.endswith(event_provider.hostname_suffixes):
+            continue
         if event_provider.identifier(url_parsed):
-            LOGGER.info(f"URL recognized as belonging to event provider {event_provider.name}")
-            scraped_events = await event_provider.scrape_func(browser, url, max_events)
-            LOGGER.info(f"Successfully scraped {len(scraped_events)} events from {url}")
-            return scraped_events
-    # no match
-    raise UnknownEventProviderError(f"Could not determine event provider for provided URL: {url}")
+            return event_provider
+    return None
+
+
+async def scrape_events(browser: Browser, url: str, max_events: int, page_pool: PagePool | None = None) -> list[Event]:
+    LOGGER.info(f"Processing URL: {url}")
+    cache_key = (url, max_events)
+    lock = _SCRAPE_LOCKS.get(cache_key)
+    if lock is None:
+        lock = _SCRAPE_LOCKS[cache_key] = asyncio.Lock()
+    async with lock:
+        cached_events = _SCRAPED_EVENTS_CACHE.get(cache_key)
+        if cached_events is not None:
+            LOGGER.info(f"Returning {len(cached_events)} cached events for {url}")
+            return list(cached_events)
+        with track_event_failures() as event_failures:
+            scraped_events = await _scrape_events_uncached(browser, url, max_events, page_pool)
+        # no events more likely means the scrape went wrong (e.g. the listing timed out) than that there are none, and
+        # some event pages failing leaves the events incomplete, so in either case the next request tries again
+        if event_failures.failed:
+            failed_count = len(event_failures.failed)
+            LOGGER.info(f"Not caching events for {url}, since {failed_count} event pages failed to scrape")
+        elif scraped_events and event_failures.skipped:
+            # events skipped for failing recently are tried again once they're no longer skipped, so only keep the
+            # result until then
+            _SCRAPED_EVENTS_CACHE.set(cache_key, scraped_events, ttl_s=get_env().failed_event_cache_ttl_s)
+        elif scraped_events:
+            _SCRAPED_EVENTS_CACHE.set(cache_key, scraped_events)
+        return list(scraped_events)
+
+
+async def _scrape_events_uncached(browser: Browser, url: str, max_events: int, page_pool: PagePool | None) -> list[Event]:
+    url_parsed = _parse_url(url)
+    event_provider = _find_event_provider(url_parsed)
+    if event_provider is None:
+        raise UnknownEventProviderError(f"Could not determine event provider for provided URL: {url}")
+    LOGGER.info(f"URL recognized as belonging to event provider {event_provider.name}")
+    scraped_events = await event_provider.scrape_func(browser, url, max_events, page_pool)
+    LOGGER.info(f"Successfully scraped {len(scraped_events)} events from {url}")
+    return scraped_events
@@ -2,23 +2,31 @@ import json
 import logging
 import re
 from datetime import datetime
+from html.parser import HTMLParser
 from urllib.parse import ParseResult as ParsedUrl
 
-from playwright.async_api import Browser
+from playwright.async_api import Browser, Error as PlaywrightError
 
 from scraping_events.exceptions import ParsingError
-from scraping_events.playwright_utils import PageWrapper
+from scraping_events.playwright_utils import (
+    PagePool,
+    PageWrapper,
+    ensure_page_pool,
+    scrape_event_pages,
+)
 from scraping_events.schemas import Event
 
 LOGGER = logging.getLogger(__name__)
 
+_LUMA_HOSTNAME_RE = re.compile(r"(.*\.)?(lu\.ma|luma\.com)", re.IGNORECASE)
+
 
 def is_luma_url(url_parsed: ParsedUrl) -> bool:
     """Check if URL is a Luma events URL (lu.ma or luma.com)."""
     hostname = url_parsed.hostname
     if hostname is None:
         return False
-    return re.fullmatch(r"(.*\.)?(lu\.ma|luma\.com)", hostname, flags=re.IGNORECASE) is not None
+    return _LUMA_HOSTNAME_RE.fullmatch(hostname) is not None
 
 
 def _extract_json_ld(page_source: str | None) -> dict | None:
@@ -92,17 +100,29 @@ def _event_from_json_ld(json_ld: dict, event_url: str) -> Event:
     )
 
 
-async def _get_json_ld(page_wrapper: PageWrapper, url: str) -> dict | None:
-    """Navigate to a URL and return the first JSON-LD object, or None."""
-    await page_wrapper.navigate(url)
-    page = page_wrapper.page
-    await page.wait_for_load_state("domcontentloaded")
+class _JsonLdScriptParser(HTMLParser):
+    """Collects the text content of an HTML document's JSON-LD script tags."""
+
+    def __init__(self):
+        super().__init__()
+        self.json_ld_texts: list[str] = []
+        self._in_json_ld_script = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        if tag == "script" and dict(attrs).get("type") == "application/ld+json":
+            self._in_json_ld_script = True
+            self.json_ld_texts.append("")
+
+    def handle_endtag(self, tag: str):
+        if tag == "script":
+            self._in_json_ld_script = False
 
-    json_ld_texts: list[str] = await page.evaluate("""() => {
-        const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-        return Array.from(scripts).map(s => s.textContent);
-    }""")
+    def handle_data(self, data: str):
+        if self._in_json_ld_script:
+            self.json_ld_texts[-1] += data
 
+
+def _first_json_ld(json_ld_texts: list[str]) -> dict | None:
     for text in json_ld_texts:
         result = _extract_json_ld(text)
         if result:
@@ -110,15 +130,54 @@ async def _get_json_ld(page_wrapper: PageWrapper, url: str) -> dict | None:
     return None
 
 
-async def scrape_luma(browser: Browser, url: str, max_events: int) -> list[Event]:
+async def _fetch_json_ld(page_wrapper: PageWrapper, url: str) -> dict | None:
+    """Fetch a URL's HTML without rendering it and return the first JSON-LD object, or None."""
+    try:
+        response = await page_wrapper.page.context.request.get(url)
+    except PlaywrightError as e:
+        LOGGER.info(f"Failed to fetch {url} directly, falling back to the browser: {e}")
+        return None
+    try:
+        if not response.ok:
+            LOGGER.info(f"Failed to fetch {url} directly, falling back to the browser: {response.status}")
+            return None
+        parser = _JsonLdScriptParser()
+        parser.feed(await response.text())
+        parser.close()
+    finally:
+        await response.dispose()
+    return _first_json_ld(parser.json_ld_texts)
+
+
+async def _get_json_ld(page_wrapper: PageWrapper, url: str) -> dict | None:
+    """Return the first JSON-LD object on a URL's page, or None.
+
+    Luma serves its JSON-LD as part of the page's HTML, so the HTML is fetched directly first. The page is only loaded
+    in the browser if that doesn't turn up any JSON-LD.
+    """
+    json_ld = await _fetch_json_ld(page_wrapper, url)
+    if json_ld is not None:
+        return json_ld
+
+    # JSON-LD is part of the served HTML, so neither subresources nor the rest of the page load are needed
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(url, wait_until="domcontentloaded")
+    page = page_wrapper.page
+
+    json_ld_texts = await page.locator('script[type="application/ld+json"]').all_text_contents()
+    return _first_json_ld(json_ld_texts)
+
+
+async def scrape_luma(browser: Browser, url: str, max_events: int, page_pool: PagePool | None = None) -> list[Event]:
     """Scrape events from a Luma URL (single event or organizer/calendar page).
 
     Routing is based on JSON-LD @type:
     - @type=Event: scrape that single event directly
     - @type=Organization: extract event URLs from the nested events[] array
     """
-    async with PageWrapper.open(browser) as page_wrapper:
-        json_ld = await _get_json_ld(page_wrapper, url)
+    async with ensure_page_pool(browser, page_pool) as pool:
+        async with pool.acquire(url) as page_wrapper:
+            json_ld = await _get_json_ld(page_wrapper, url)
         if json_ld is None:
             raise ParsingError(f"No JSON-LD found on {url}")
 
@@ -134,22 +193,20 @@ async def scrape_luma(browser: Browser, url: str, max_events: int) -> list[Event
             if not isinstance(nested_events, list):
                 return []
 
-            events: list[Event] = []
+            nested_events_by_url: dict[str, dict] = {}
             for event_ld in nested_events[:max_events]:
                 if not isinstance(event_ld, dict) or event_ld.get("@type") != "Event":
                     continue
-                event_url = event_ld.get("@id") or url
-                try:
-                    # The nested JSON-LD may be partial — navigate to the full event page
-                    full_ld = await _get_json_ld(page_wrapper, event_url)
-                    if full_ld and full_ld.get("@type") == "Event":
-                        events.append(_event_from_json_ld(full_ld, event_url))
-                    else:
-                        # Fall back to the partial nested data
-                        events.append(_event_from_json_ld(event_ld, event_url))
-                except (ParsingError, Exception) as e:
-                    LOGGER.error(f"Failed to scrape event {event_url}: {e}")
-                    continue
-            return events
+                nested_events_by_url.setdefault(event_ld.get("@id") or url, event_ld)
+
+            async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event:
+                # The nested JSON-LD may be partial — navigate to the full event page
+                full_ld = await _get_json_ld(page_wrapper, event_url)
+                if full_ld and full_ld.get("@type") == "Event":
+                    return _event_from_json_ld(full_ld, event_url)
+                # Fall back to the partial nested data
+                return _event_from_json_ld(nested_events_by_url[event_url], event_url)
+
+            return await scrape_event_pages(browser, list(nested_events_by_url), _get_event_details, pool)
 
         raise ParsingError(f"Unexpected JSON-LD @type '{ld_type}' on {url}")
@@ -6,17 +6,19 @@ from urllib.parse import ParseResult as ParsedUrl, urlparse
 from playwright.async_api import Browser, TimeoutError as PlaywrightTimeoutError
 
 from scraping_events.exceptions import ParsingError
-from scraping_events.playwright_utils import PageWrapper
+from scraping_events.playwright_utils import PagePool, PageWrapper, open_page
 from scraping_events.schemas import Event
 
 LOGGER = logging.getLogger(__name__)
 
+_MEETUP_HOSTNAME_RE = re.compile(r".*\.?meetup\.com", re.IGNORECASE)
+
 
 def is_meetup_url(url_parsed: ParsedUrl) -> bool:
     hostname = url_parsed.hostname
     if hostname is None:
         return False
-    return re.fullmatch(r".*\.?meetup\.com", hostname, flags=re.IGNORECASE) is not None
+    return _MEETUP_HOSTNAME_RE.fullmatch(hostname) is not None
 
 
 def _extract_group_url(url: str) -> str | None:
@@ -202,8 +204,8 @@ def _parse_timestamp(timestamp_str: str) -> datetime:
         raise ParsingError(f"`datetime.strptime` failed to parse timestamp: {time_naive_str!r}") from e
 
 
-async def scrape_meetup(browser: Browser, url: str, max_events: int) -> list[Event]:
-    async with PageWrapper.open(browser) as page_wrapper:
+async def scrape_meetup(browser: Browser, url: str, max_events: int, page_pool: PagePool | None = None) -> list[Event]:
+    async with open_page(browser, url, page_pool) as page_wrapper:
         event_urls = await _get_upcoming_event_urls(page_wrapper, url, max_events)
         events: list[Event] = [await _get_event_details(page_wrapper, event_url) for event_url in event_urls]
         return events
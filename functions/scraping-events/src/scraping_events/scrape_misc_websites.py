@@ -1,13 +1,21 @@
+import dataclasses
 import logging
 import re
-from datetime import datetime
-from urllib.parse import ParseResult as ParsedUrl
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Any, Self
+from urllib.parse import ParseResult as ParsedUrl, urljoin, urlparse
 
 from playwright.async_api import Browser, TimeoutError as PlaywrightTimeoutError
 
-from scraping_events.exceptions import ParsingError
-from scraping_events.playwright_utils import PageWrapper
+from scraping_events.datetime_parsing import parse_event_time
+from scraping_events.exceptions import PageTimeoutError, ParsingError
+from scraping_events.playwright_utils import (
+    PagePool,
+    PageWrapper,
+    first_matches,
+    query_all_matches,
+    scrape_listed_events,
+)
 from scraping_events.schemas import Event
 
 LOGGER = logging.getLogger(__name__)
@@ -16,162 +24,236 @@ LOGGER = logging.getLogger(__name__)
 MISC_WEBSITE_CONFIGS = {
     "kiln.utah.gov": {
         "name": "Kiln Coworking Space",
-        "event_selectors": [
+        "event_selectors": (
             '.event-item a',
             '.calendar-event a',
             'a[href*="/events/"]',
-            '.upcoming-events a'
-        ],
-        "title_selectors": [
+            '.upcoming-events a',
+        ),
+        "title_selectors": (
             'h1.event-title',
             'h1',
             '.page-title',
-            '.event-header h1'
-        ],
-        "desc_selectors": [
+            '.event-header h1',
+        ),
+        "desc_selectors": (
             '.event-description',
             '.event-content',
             '.content',
-            'main p'
-        ],
-        "time_selectors": [
+            'main p',
+        ),
+        "time_selectors": (
             '.event-date',
             '.event-time',
             'time[datetime]',
-            '.date-time'
-        ],
-        "location_selectors": [
+            '.date-time',
+        ),
+        "location_selectors": (
             '.event-location',
             '.location',
-            '.venue'
-        ],
+            '.venue',
+        ),
         "default_location": "Kiln Coworking Space, Salt Lake City, UT"
     },
     "wework.com": {
         "name": "WeWork",
-        "event_selectors": [
+        "event_selectors": (
             '.event-card a',
             '.community-event a',
             'a[href*="/events/"]',
-            '.events-list a'
-        ],
-        "title_selectors": [
+            '.events-list a',
+        ),
+        "title_selectors": (
             'h1.event-title',
             'h1',
             '.event-name',
-            '.title'
-        ],
-        "desc_selectors": [
+            '.title',
+        ),
+        "desc_selectors": (
             '.event-description',
             '.description',
             '.event-details',
-            '.content'
-        ],
-        "time_selectors": [
+            '.content',
+        ),
+        "time_selectors": (
             '.event-date',
             '.date-time',
             'time[datetime]',
-            '.when'
-        ],
-        "location_selectors": [
+            '.when',
+        ),
+        "location_selectors": (
             '.event-location',
             '.location',
             '.where',
-            '.venue'
-        ],
+            '.venue',
+        ),
         "default_location": "WeWork Salt Lake City, UT"
     },
     "siliconslopestechsummit.com": {
         "name": "Silicon Slopes",
-        "event_selectors": [
+        "event_selectors": (
             '.event-item a',
             '.session a',
             'a[href*="/events/"]',
-            '.agenda-item a'
-        ],
-        "title_selectors": [
+            '.agenda-item a',
+        ),
+        "title_selectors": (
             'h1.event-title',
             'h1',
             '.session-title',
-            '.event-name'
-        ],
-        "desc_selectors": [
+            '.event-name',
+        ),
+        "desc_selectors": (
             '.event-description',
             '.session-description',
             '.description',
-            '.content'
-        ],
-        "time_selectors": [
+            '.content',
+        ),
+        "time_selectors": (
             '.event-time',
             '.session-time',
             'time[datetime]',
-            '.schedule-time'
-        ],
-        "location_selectors": [
+            '.schedule-time',
+        ),
+        "location_selectors": (
             '.event-location',
             '.venue',
-            '.location'
-        ],
+            '.location',
+        ),
         "default_location": "Salt Palace Convention Center, Salt Lake City, UT"
     },
     "utahgeekevents.com": {
         "name": "Utah Geek Events",
-        "event_selectors": [
+        "event_selectors": (
             '.event-listing a',
             '.event-item a',
             'a[href*="/events/"]',
-            '.calendar-event a'
-        ],
-        "title_selectors": [
+            '.calendar-event a',
+        ),
+        "title_selectors": (
             'h1.event-title',
             'h1',
             '.event-name',
-            '.title'
-        ],
-        "desc_selectors": [
+            '.title',
+        ),
+        "desc_selectors": (
             '.event-description',
             '.description',
             '.event-details',
-            '.content'
-        ],
-        "time_selectors": [
+            '.content',
+        ),
+        "time_selectors": (
             '.event-date',
             '.event-time',
             'time[datetime]',
-            '.when'
-        ],
-        "location_selectors": [
+            '.when',
+        ),
+        "location_selectors": (
             '.event-location',
             '.location',
-            '.venue'
-        ],
+            '.venue',
+        ),
         "default_location": "Various locations in Utah"
     }
 }
 
+# Absolute, deduplicated hrefs of the links matched by the first selector (in priority order) that matches any, each
+# with the location shown on its event card (if any), along with that selector. A link's card is taken to be its
+# largest ancestor that contains no link to another event.
+_FIRST_SELECTOR_LINKS_JS = """([selectors, locationSelectors]) => {
+    const locationSelector = locationSelectors.join(', ');
+    const cardLocation = (link, links) => {
+        let card = link;
+        while (card.parentElement && !links.some(other => other.href !== link.href && card.parentElement.contains(other))) {
+            card = card.parentElement;
+        }
+        // with no other event to bound it, the "card" is the whole page
+        if (card.contains(document.body)) return null;
+        const location = card.querySelector(locationSelector);
+        return location ? location.innerText.trim() || null : null;
+    };
+    for (const selector of selectors) {
+        const links = Array.from(document.querySelectorAll(selector)).filter(a => a.href);
+        if (!links.length) continue;
+        const locationsByHref = new Map();
+        for (const link of links) {
+            if (!locationsByHref.has(link.href)) locationsByHref.set(link.href, cardLocation(link, links));
+        }
+        return [selector, Array.from(locationsByHref)];
+    }
+    return [null, []];
+}"""
+
+_IMG_SELECTORS = [
+    '.event-image img',
+    '.hero-image img',
+    'main img',
+    'article img'
+]
+
+_ONLINE_RE = re.compile(r'\b(?:online|virtual|zoom|teams)\b', re.IGNORECASE)
+# "UT" only as a word of its own, so that it doesn't match inside words like "Austin"
+_UTAH_RE = re.compile(r'utah|\but\b|salt lake|provo|ogden|park city|byu', re.IGNORECASE)
+# another state's postal code after a comma, as in "Austin, TX", which marks a location as definitely not in Utah
+_OTHER_STATE_CODES = (
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DC', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA',
+    'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR',
+    'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+)
+_OTHER_STATE_RE = re.compile(rf',\s*(?:{"|".join(_OTHER_STATE_CODES)})\b')
+
+
+@dataclasses.dataclass(frozen=True)
+class _PreparedConfig:
+    """A misc website's configuration, along with everything derived from it, worked out once per site."""
+    name: str
+    default_location: str
+    event_selectors: tuple[str, ...]
+    title_selectors: tuple[str, ...]
+    desc_selectors: tuple[str, ...]
+    time_selectors: tuple[str, ...]
+    location_selectors: tuple[str, ...]
+    event_selectors_union: str
+    """The event selectors combined into one CSS selector list, for waiting on whichever shows up first"""
+    title_selectors_union: str
+    """The title selectors combined into one CSS selector list, for waiting on whichever shows up first"""
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> Self:
+        return cls(
+            name=config["name"],
+            default_location=config["default_location"],
+            event_selectors=tuple(config["event_selectors"]),
+            title_selectors=tuple(config["title_selectors"]),
+            desc_selectors=tuple(config["desc_selectors"]),
+            time_selectors=tuple(config["time_selectors"]),
+            location_selectors=tuple(config["location_selectors"]),
+            event_selectors_union=", ".join(config["event_selectors"]),
+            title_selectors_union=", ".join(config["title_selectors"]),
+        )
 
-def is_misc_website_url(url_parsed: ParsedUrl) -> bool:
-    """Check if URL is a supported misc website."""
-    hostname = url_parsed.hostname
-    if hostname is None:
-        return False
-    
-    # Check against our configured misc websites
-    for configured_domain in MISC_WEBSITE_CONFIGS.keys():
-        if configured_domain in hostname.lower():
-            return True
-    
-    return False
 
+_PREPARED_CONFIGS = {domain: _PreparedConfig.from_config(config) for domain, config in MISC_WEBSITE_CONFIGS.items()}
 
-def _get_website_config(url: str) -> Optional[Dict]:
+
+def _get_website_config(url: str) -> _PreparedConfig | None:
     """Get configuration for a misc website based on URL."""
-    for domain, config in MISC_WEBSITE_CONFIGS.items():
-        if domain in url.lower():
+    return _config_for_host((urlparse(url).hostname or '').lower())
+
+
+@lru_cache(maxsize=256)
+def _config_for_host(hostname: str) -> _PreparedConfig | None:
+    for domain, config in _PREPARED_CONFIGS.items():
+        if domain in hostname:
             return config
     return None
 
 
+def is_misc_website_url(url_parsed: ParsedUrl) -> bool:
+    """Check if URL is a supported misc website."""
+    return _config_for_host((url_parsed.hostname or '').lower()) is not None
+
+
 async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str, max_events: int) -> list[str]:
     """Get upcoming event URLs from a misc website."""
     LOGGER.info(f"Looking for upcoming events on misc website: {starting_url}")
@@ -181,61 +263,42 @@ async def _get_upcoming_event_urls(page_wrapper: PageWrapper, starting_url: str,
         LOGGER.error(f"No configuration found for website: {starting_url}")
         return []
     
-    await page_wrapper.navigate(starting_url)
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(starting_url, wait_until='domcontentloaded')
     page = page_wrapper.page
     
-    # Wait for the page to load
+    # Wait for the page to load, i.e. for whichever of the configured selectors matches first
     try:
-        # Try to wait for any of the configured selectors
-        for selector in config["event_selectors"]:
-            try:
-                await page.wait_for_selector(selector, timeout=3000)
-                break
-            except PlaywrightTimeoutError:
-                continue
-        else:
-            LOGGER.info(f"No events found on {starting_url}")
-            return []
+        await page.wait_for_selector(config.event_selectors_union, timeout=5000)
+    except PlaywrightTimeoutError:
+        LOGGER.info(f"No events found on {starting_url}")
+        return []
     except Exception as e:
         LOGGER.warning(f"Error waiting for page elements: {e}")
         return []
     
-    # Find all event links using configured selectors
-    event_urls: list[str] = []
+    # Find all event links using the first configured selector that matches any, in one round-trip
+    try:
+        selector, links = await page.evaluate(
+            _FIRST_SELECTOR_LINKS_JS, [config.event_selectors, config.location_selectors]
+        )
+    except Exception as e:
+        LOGGER.warning(f"Error finding event links on {starting_url}: {e}")
+        return []
     
-    for selector in config["event_selectors"]:
-        try:
-            event_links = page.locator(selector)
-            count = await event_links.count()
-            
-            if count > 0:
-                LOGGER.info(f"Found {count} event links using selector: {selector}")
-                
-                for i in range(min(count, max_events)):
-                    try:
-                        event_url = await event_links.nth(i).get_attribute('href')
-                        if event_url:
-                            # Ensure full URL
-                            if event_url.startswith('/'):
-                                base_url = f"{page.url.split('/')[0]}//{page.url.split('/')[2]}"
-                                event_url = f"{base_url}{event_url}"
-                            elif not event_url.startswith('http'):
-                                event_url = f"{starting_url.rstrip('/')}/{event_url}"
-                            
-                            # Avoid duplicate URLs
-                            if event_url not in event_urls:
-                                event_urls.append(event_url)
-                                LOGGER.info(f"Found event URL: {event_url}")
-                    except Exception as e:
-                        LOGGER.warning(f"Error extracting URL from event link {i}: {e}")
-                        continue
-                
-                if event_urls:  # If we found events with this selector, use them
-                    break
-                    
-        except Exception as e:
-            LOGGER.warning(f"Error with selector {selector}: {e}")
+    if links:
+        LOGGER.info(f"Found {len(links)} event links using selector: {selector}")
+    
+    event_urls: list[str] = []
+    for event_url, card_location in links:
+        # Skip opening events whose card already shows they're out of state. Cards often just name the town (e.g.
+        # "Lehi"), so anything less certain is left to the check on the event's own page.
+        if card_location and _is_out_of_state(card_location):
+            LOGGER.info(f"Skipping non-Utah event: {event_url} at {card_location}")
             continue
+        event_urls.append(event_url)
+        if len(event_urls) >= max_events:
+            break
     
     LOGGER.info(f"Collected {len(event_urls)} event URLs")
     return event_urls
@@ -249,62 +312,39 @@ async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event
     if not config:
         raise ParsingError(f"No configuration found for event URL: {event_url}")
     
-    await page_wrapper.navigate(event_url)
+    await page_wrapper.block_requests()
+    await page_wrapper.navigate(event_url, wait_until='domcontentloaded')
     page = page_wrapper.page
     
-    # Wait for page to load
-    await page.wait_for_load_state('networkidle')
+    # Wait for the title rather than for the network to go idle, which tracker-heavy pages can put off for seconds
+    try:
+        await page.wait_for_selector(config.title_selectors_union, timeout=8000)
+    except PlaywrightTimeoutError:
+        raise PageTimeoutError(event_url)
     
     try:
-        # Title
-        event_title = None
-        for selector in config["title_selectors"]:
-            try:
-                event_title = await page.locator(selector).first.inner_text()
-                if event_title and event_title.strip():
-                    break
-            except Exception:
-                continue
+        matches = await query_all_matches(page, {
+            'title': (config.title_selectors, None),
+            'description': (config.desc_selectors, None),
+            'time': (config.time_selectors, ('datetime', None)),
+            'location': (config.location_selectors, None),
+            'image_url': (_IMG_SELECTORS, 'src'),
+        })
+        fields = first_matches(matches)
         
+        # Title
+        event_title = fields['title']
         if not event_title:
             raise ParsingError(f"Could not find event title for {event_url}")
         
         event_title = event_title.strip()
         
         # Description
-        description = ""
-        for selector in config["desc_selectors"]:
-            try:
-                description = await page.locator(selector).first.inner_text()
-                if description and description.strip():
-                    break
-            except Exception:
-                continue
-        
+        description = fields['description']
         description = description.strip() if description else ""
         
-        # Date and time
-        event_time = None
-        for selector in config["time_selectors"]:
-            try:
-                time_elem = page.locator(selector).first
-                
-                # Try to get datetime attribute first
-                datetime_str = await time_elem.get_attribute('datetime')
-                if datetime_str:
-                    event_time = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-                    break
-                
-                # If no datetime attribute, try to parse text content
-                time_text = await time_elem.inner_text()
-                if time_text:
-                    event_time = _parse_misc_datetime(time_text)
-                    if event_time:
-                        break
-                        
-            except Exception as e:
-                LOGGER.warning(f"Error parsing time with selector {selector}: {e}")
-                continue
+        # Date and time - the first of the candidates that parses
+        event_time = parse_event_time(matches['time'])
         
         if not event_time:
             LOGGER.warning(f"Could not parse event time for {event_url}")
@@ -314,65 +354,33 @@ async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event
         venue_address = None
         venue_url = None
         
-        for selector in config["location_selectors"]:
-            try:
-                location_elem = page.locator(selector).first
-                location_text = await location_elem.inner_text()
-                
-                if location_text and location_text.strip():
-                    location_text = location_text.strip()
-                    
-                    # Check if it's an online event
-                    if any(keyword in location_text.lower() for keyword in ['online', 'virtual', 'zoom', 'teams']):
-                        venue_name = location_text
-                        venue_address = location_text
-                    else:
-                        venue_name = location_text
-                        venue_address = location_text
-                    break
-                    
-            except Exception as e:
-                LOGGER.warning(f"Error parsing location with selector {selector}: {e}")
-                continue
+        location_text = fields['location']
+        if location_text:
+            location_text = location_text.strip()
+            
+            # Check if it's an online event
+            if _ONLINE_RE.search(location_text):
+                venue_name = location_text
+                venue_address = location_text
+            else:
+                venue_name = location_text
+                venue_address = location_text
         
         # If no specific location found, use default
         if not venue_name and not venue_address:
-            venue_name = config["name"]
-            venue_address = config["default_location"]
+            venue_name = config.name
+            venue_address = config.default_location
         
         # UTAH FILTERING: Skip events not in Utah
-        if venue_address:
-            location_lower = venue_address.lower()
-            utah_indicators = ['utah', 'ut', 'salt lake', 'provo', 'ogden', 'park city', 'byu', 'university of utah']
-            
-            # If it's not online and doesn't mention Utah, skip it
-            is_online = any(keyword in location_lower for keyword in ['online', 'virtual', 'zoom', 'teams'])
-            has_utah = any(indicator in location_lower for indicator in utah_indicators)
-            
-            if not is_online and not has_utah:
-                LOGGER.info(f"Skipping non-Utah event: {event_title} at {venue_address}")
-                raise ParsingError(f"Event not in Utah: {event_url}")
+        if venue_address and not _is_utah_or_online(venue_address):
+            LOGGER.info(f"Skipping non-Utah event: {event_title} at {venue_address}")
+            raise ParsingError(f"Event not in Utah: {event_url}")
         
         # Image
-        image_url = None
-        img_selectors = [
-            '.event-image img',
-            '.hero-image img',
-            'main img',
-            'article img'
-        ]
-        
-        for selector in img_selectors:
-            try:
-                image_url = await page.locator(selector).first.get_attribute('src')
-                if image_url:
-                    # Ensure full URL
-                    if image_url.startswith('/'):
-                        base_url = f"{page.url.split('/')[0]}//{page.url.split('/')[2]}"
-                        image_url = f"{base_url}{image_url}"
-                    break
-            except Exception:
-                continue
+        image_url = fields['image_url']
+        # Ensure full URL, resolving it the way the page itself would
+        if image_url:
+            image_url = urljoin(page.url, image_url)
         
         return Event(
             url=event_url,
@@ -390,50 +398,16 @@ async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event
         raise ParsingError(f"Failed to extract event details from {event_url}") from e
 
 
-def _parse_misc_datetime(time_text: str) -> Optional[datetime]:
-    """Parse datetime format from misc websites."""
-    try:
-        # Generic datetime parsing for misc websites
-        # This is a simplified parser - might need refinement based on actual formats
-        
-        # Remove common words and normalize
-        cleaned = re.sub(r'\s+at\s+', ' ', time_text)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        # Try different parsing patterns
-        patterns = [
-            r'(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)',
-            r'(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, cleaned, re.IGNORECASE)
-            if match:
-                # This would need proper date parsing logic
-                # For now, return None to avoid errors
-                LOGGER.warning(f"Date parsing not fully implemented for: {time_text}")
-                return None
-        
-        return None
-        
-    except Exception as e:
-        LOGGER.error(f"Error parsing misc website datetime '{time_text}': {e}")
-        return None
+def _is_utah_or_online(location_text: str) -> bool:
+    """Check if a location is in Utah, or online."""
+    return bool(_UTAH_RE.search(location_text) or _ONLINE_RE.search(location_text))
+
 
+def _is_out_of_state(location_text: str) -> bool:
+    """Check if a location is definitely in another state, rather than just not known to be in Utah."""
+    return not _is_utah_or_online(location_text) and _OTHER_STATE_RE.search(location_text) is not None
 
-async def scrape_misc_website(browser: Browser, url: str, max_events: int) -> list[Event]:
+
+async def scrape_misc_website(browser: Browser, url: str, max_events: int, page_pool: PagePool | None = None) -> list[Event]:
     """Scrape events from a misc website."""
-    async with PageWrapper.open(browser) as page_wrapper:
-        event_urls = await _get_upcoming_event_urls(page_wrapper, url, max_events)
-        events: list[Event] = []
-        
-        for event_url in event_urls:
-            try:
-                event = await _get_event_details(page_wrapper, event_url)
-                events.append(event)
-            except Exception as e:
-                LOGGER.error(f"Failed to scrape event {event_url}: {e}")
-                continue
-        
-        return events
\ No newline at end of file
+    return await scrape_listed_events(browser, url, max_events, _get_upcoming_event_urls, _get_event_details, page_pool)
@@ -0,0 +1,99 @@
+"""Unit tests for the in-memory TTL cache."""
+
+import pytest
+
+from scraping_events import caching
+from scraping_events.caching import TTLCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(caching.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+def test_get_returns_value_until_expiry(clock: _FakeClock) -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=10)
+    cache.set("a", 1)
+
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    assert "a" in cache
+
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+@pytest.mark.usefixtures("clock")
+def test_missing_key_returns_none() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=10)
+    assert cache.get("missing") is None
+    assert "missing" not in cache
+
+
+def test_set_again_restarts_expiry(clock: _FakeClock) -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=10)
+    cache.set("a", 1)
+    clock.now += 5
+    cache.set("a", 2)
+
+    clock.now += 9
+    assert cache.get("a") == 2
+
+
+def test_set_with_shorter_ttl_expires_sooner(clock: _FakeClock) -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=10)
+    cache.set("a", 1, ttl_s=5)
+    cache.set("b", 2, ttl_s=20)
+
+    clock.now += 5
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    # never kept past the cache's own TTL
+    clock.now += 5
+    assert cache.get("b") is None
+
+
+@pytest.mark.usefixtures("clock")
+def test_oldest_entry_evicted_at_maxsize() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+@pytest.mark.usefixtures("clock")
+def test_set_again_moves_entry_to_back_of_eviction_order() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+    cache.set("c", 4)
+
+    assert cache.get("a") == 3
+    assert cache.get("b") is None
+    assert cache.get("c") == 4
+
+
+@pytest.mark.usefixtures("clock")
+@pytest.mark.parametrize("ttl_s", [0, -1])
+def test_non_positive_ttl_disables_caching(ttl_s: float) -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_s=ttl_s)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert "a" not in cache
@@ -0,0 +1,63 @@
+"""Unit tests for parsing event page dates and times as Mountain time."""
+
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from scraping_events.datetime_parsing import parse_event_time, parse_mountain_datetime
+
+_DENVER = ZoneInfo("America/Denver")
+
+
+@pytest.mark.parametrize(
+    ("time_text", "expected"),
+    [
+        ("December 14, 2024 at 2:00 PM", datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        ("Dec 14, 2024 2:00 PM", datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        ("December 14 2024 at 9:30am", datetime(2024, 12, 14, 9, 30, tzinfo=_DENVER)),
+        ("12/14/2024 2:00 PM", datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        ("2024-12-14 14:00", datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        ("Saturday,  December 14, 2024   at  2:00 PM MST", datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        ("Thursday, April 3, 2025\n at 12:15 PM", datetime(2025, 4, 3, 12, 15, tzinfo=_DENVER)),
+    ],
+)
+def test_parse_mountain_datetime_formats(time_text: str, expected: datetime) -> None:
+    assert parse_mountain_datetime(time_text) == expected
+
+
+@pytest.mark.parametrize(
+    ("time_text", "utc_offset"),
+    [
+        ("January 15, 2025 at 6:00 PM", timedelta(hours=-7)),
+        ("July 15, 2025 at 6:00 PM", timedelta(hours=-6)),
+    ],
+)
+def test_parse_mountain_datetime_is_mountain_time(time_text: str, utc_offset: timedelta) -> None:
+    parsed = parse_mountain_datetime(time_text)
+    assert parsed is not None
+    assert parsed.tzinfo == _DENVER
+    assert parsed.utcoffset() == utc_offset
+
+
+@pytest.mark.parametrize(
+    "time_text",
+    ["", "TBD", "Spring semester", "Smarch 14, 2024 at 2:00 PM", "13/45/2024 2:00 PM", "02/30/2025 1:00 PM"],
+)
+def test_parse_mountain_datetime_unparseable(time_text: str) -> None:
+    assert parse_mountain_datetime(time_text) is None
+
+
+@pytest.mark.parametrize(
+    ("candidates", "expected"),
+    [
+        (["2030-01-01T18:00:00Z", "Jan 1"], datetime(2030, 1, 1, 18, 0, tzinfo=UTC)),
+        # candidates that don't parse are passed over
+        (["Fall semester", "December 14, 2024 at 2:00 PM"], datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        (["next Tuesday", "2024-12-14 14:00"], datetime(2024, 12, 14, 14, 0, tzinfo=_DENVER)),
+        (["Dec 14", "TBD"], None),
+        ([], None),
+    ],
+)
+def test_parse_event_time_takes_first_parseable_candidate(candidates: list[str], expected: datetime | None) -> None:
+    assert parse_event_time(candidates) == expected
@@ -0,0 +1,426 @@
+"""Unit tests for the Playwright helpers shared by the scrapers."""
+
+import asyncio
+import json
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import Browser, BrowserContext, Error as PlaywrightError, Page
+
+from scraping_events import playwright_utils
+from scraping_events.caching import TTLCache
+from scraping_events.env import get_env
+from scraping_events.exceptions import NavigationError, PageTimeoutError, ParsingError
+from scraping_events.playwright_utils import (
+    PagePool,
+    PageWrapper,
+    _all_matches,
+    ensure_page_pool,
+    iter_listed_events,
+    query_all_matches,
+    query_first_matches,
+    scrape_event_pages,
+)
+from scraping_events.schemas import Event
+
+_NODE = shutil.which("node")
+
+_TIME_QUERY = ([".event-date", ".event-time", "time[datetime]"], ("datetime", None))
+
+
+@pytest.mark.parametrize(
+    ("reads_by_selector", "expected"),
+    [
+        # attributes first, even a later selector's, then text
+        (
+            [[None, "Sometime soon"], None, ["2030-01-01T18:00:00-07:00", "Jan 1"]],
+            ["2030-01-01T18:00:00-07:00", "Sometime soon", "Jan 1"],
+        ),
+        # blank reads are left out
+        ([[None, "  "], [None, "January 1, 2030 at 6:00 PM"], [None, "Jan 1"]], ["January 1, 2030 at 6:00 PM", "Jan 1"]),
+        ([None, None, None], []),
+        ([["", " "], None, [None, None]], []),
+    ],
+)
+def test_all_matches_tries_each_read_with_every_selector(
+    reads_by_selector: list[list[str | None] | None], expected: list[str]
+) -> None:
+    assert _all_matches(reads_by_selector, 2) == expected
+
+
+async def test_query_first_matches_picks_from_one_evaluate() -> None:
+    page = MagicMock(spec=Page)
+    page.evaluate = AsyncMock(return_value={
+        "time": [[None, "Sometime soon"], None, ["2030-01-01T18:00:00-07:00", "Jan 1"]],
+        "title": [None, ["Title"]],
+    })
+    fields = await query_first_matches(page, {"time": _TIME_QUERY, "title": (["h1.event-title", "h1"], None)})
+
+    assert fields == {"time": "2030-01-01T18:00:00-07:00", "title": "Title"}
+    page.evaluate.assert_awaited_once()
+    assert page.evaluate.await_args.args[1] == {
+        "time": [[".event-date", ".event-time", "time[datetime]"], ["datetime", None]],
+        "title": [["h1.event-title", "h1"], [None]],
+    }
+
+
+async def test_query_all_matches_lists_every_match() -> None:
+    page = MagicMock(spec=Page)
+    page.evaluate = AsyncMock(return_value={
+        "time": [[None, "Fall semester"], None, [None, "December 14, 2024 at 2:00 PM"]],
+        "location": [None],
+    })
+    matches = await query_all_matches(page, {"time": _TIME_QUERY, "location": ([".event-location"], None)})
+
+    assert matches == {"time": ["Fall semester", "December 14, 2024 at 2:00 PM"], "location": []}
+
+
+# `document.querySelector` over elements given by selector, each with its attributes and inner text
+_STUB_DOCUMENT_JS = """
+const document = {
+    querySelector: (selector) => {
+        const element = elements[selector];
+        if (!element) return null;
+        return {
+            getAttribute: (name) => (element.attributes || {})[name] ?? null,
+            innerText: element.text ?? '',
+        };
+    },
+};
+"""
+
+
+@pytest.fixture
+def node() -> str:
+    if _NODE is None:
+        pytest.skip("node not installed")
+    return _NODE
+
+
+def _stub_page(node: str, elements: dict[str, dict[str, Any]]) -> Page:
+    """A page whose `evaluate` runs the script in Node.js against a stub DOM of the given elements."""
+
+    async def _evaluate(expression: str, arg: Any) -> Any:
+        script = (
+            f"const elements = {json.dumps(elements)};\n{_STUB_DOCUMENT_JS}\n"
+            f"console.log(JSON.stringify(({expression})({json.dumps(arg)})));"
+        )
+        process = await asyncio.create_subprocess_exec(node, "-e", script, stdout=asyncio.subprocess.PIPE)
+        stdout, _ = await process.communicate()
+        assert process.returncode == 0
+        return json.loads(stdout)
+
+    page = MagicMock(spec=Page)
+    page.evaluate = _evaluate
+    return page
+
+
+async def test_in_page_reads_prefer_later_selectors_attribute(node: str) -> None:
+    page = _stub_page(node, {
+        ".event-date": {"text": "Sometime soon"},
+        "time[datetime]": {"attributes": {"datetime": "2030-01-01T18:00:00-07:00"}, "text": "Jan 1"},
+    })
+    fields = await query_first_matches(page, {"time": _TIME_QUERY})
+    assert fields == {"time": "2030-01-01T18:00:00-07:00"}
+
+
+async def test_in_page_reads_fall_back_to_first_matching_text(node: str) -> None:
+    page = _stub_page(node, {
+        ".event-date": {"text": "  "},
+        ".event-time": {"text": "January 1, 2030 at 6:00 PM"},
+        "time[datetime]": {"text": "Jan 1"},
+    })
+    fields = await query_first_matches(page, {"time": _TIME_QUERY})
+    assert fields == {"time": "January 1, 2030 at 6:00 PM"}
+
+
+async def test_in_page_reads_single_read_queries(node: str) -> None:
+    page = _stub_page(node, {
+        "h1": {"text": "Title"},
+        "main img": {"attributes": {"src": "/image.png"}},
+    })
+    fields = await query_first_matches(page, {
+        "title": (["h1.event-title", "h1"], None),
+        "image_url": ([".event-image img", "main img"], "src"),
+        "location": ([".event-location"], None),
+    })
+    assert fields == {"title": "Title", "image_url": "/image.png", "location": None}
+
+
+def _mock_page() -> MagicMock:
+    page = MagicMock(spec=Page)
+    page.is_closed.return_value = False
+    page.unroute_all = AsyncMock()
+    page.close = AsyncMock()
+    return page
+
+
+def _mock_browser_context() -> MagicMock:
+    browser_context = MagicMock(spec=BrowserContext)
+    browser_context.new_page = AsyncMock(side_effect=_mock_page)
+    browser_context.clear_cookies = AsyncMock()
+    return browser_context
+
+
+def _make_event(url: str) -> Event:
+    return Event(
+        url=url,
+        title="Title",
+        description="",
+        time=datetime(2030, 1, 1, tzinfo=UTC),
+        venue_name=None,
+        venue_url=None,
+        venue_address=None,
+        image_url=None,
+    )
+
+
+@pytest.fixture
+def failed_event_urls(monkeypatch: pytest.MonkeyPatch) -> TTLCache[str, str]:
+    cache: TTLCache[str, str] = TTLCache(ttl_s=600)
+    monkeypatch.setattr(playwright_utils, "_FAILED_EVENT_URLS", cache)
+    return cache
+
+
+@pytest.mark.parametrize(
+    ("error", "remembered"),
+    [
+        (ParsingError("no title"), True),
+        (NavigationError("https://example.com/e", 404), True),
+        (NavigationError("https://example.com/e", 410), True),
+        (NavigationError("https://example.com/e", 503), False),
+        (NavigationError("https://example.com/e"), False),
+        (PageTimeoutError("https://example.com/e"), False),
+        (PlaywrightError("Target page, context or browser has been closed"), False),
+    ],
+)
+async def test_only_lasting_failures_are_remembered(
+    failed_event_urls: TTLCache[str, str], error: Exception, remembered: bool
+) -> None:
+    async def _get_event_details(_page_wrapper: PageWrapper, _event_url: str) -> Event:
+        raise error
+
+    pool = PagePool(_mock_browser_context(), size=1)
+    events = await scrape_event_pages(MagicMock(spec=Browser), ["https://example.com/e"], _get_event_details, pool)
+
+    assert events == []
+    assert ("https://example.com/e" in failed_event_urls) is remembered
+
+
+async def test_parsing_error_from_a_browser_error_is_not_remembered(failed_event_urls: TTLCache[str, str]) -> None:
+    calls: list[str] = []
+
+    async def _get_event_details(_page_wrapper: PageWrapper, event_url: str) -> Event:
+        calls.append(event_url)
+        if len(calls) == 1:
+            try:
+                raise PlaywrightError("net::ERR_CONNECTION_RESET")
+            except PlaywrightError as e:
+                raise ParsingError(f"Failed to extract event details from {event_url}") from e
+        return _make_event(event_url)
+
+    pool = PagePool(_mock_browser_context(), size=1)
+    browser = MagicMock(spec=Browser)
+    assert await scrape_event_pages(browser, ["https://example.com/e"], _get_event_details, pool) == []
+    assert "https://example.com/e" not in failed_event_urls
+
+    # so the next scrape tries the page again
+    events = await scrape_event_pages(browser, ["https://example.com/e"], _get_event_details, pool)
+    assert [event.url for event in events] == ["https://example.com/e"]
+    assert len(calls) == 2
+
+
+async def test_stopping_early_cancels_the_remaining_scrapes() -> None:
+    cancelled: list[str] = []
+
+    async def _get_event_details(_page_wrapper: PageWrapper, event_url: str) -> Event:
+        if event_url != "https://example.com/fast":
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(event_url)
+                raise
+        return _make_event(event_url)
+
+    async def _get_upcoming_event_urls(_page_wrapper: PageWrapper, _url: str, _max_events: int) -> list[str]:
+        return ["https://example.com/slow-1", "https://example.com/fast", "https://example.com/slow-2"]
+
+    pool = PagePool(_mock_browser_context(), size=3)
+    events = iter_listed_events(
+        MagicMock(spec=Browser), "https://example.com/events", 3, _get_upcoming_event_urls, _get_event_details, pool
+    )
+    async for event in events:
+        assert event.url == "https://example.com/fast"
+        break
+    await events.aclose()
+
+    assert sorted(cancelled) == ["https://example.com/slow-1", "https://example.com/slow-2"]
+
+
+@pytest.mark.parametrize(
+    ("goto_error", "response_status", "remembered"),
+    [
+        (PlaywrightError("net::ERR_CONNECTION_RESET"), None, False),
+        (PlaywrightError("net::ERR_NAME_NOT_RESOLVED"), None, False),
+        (None, 502, False),
+        (None, 404, True),
+    ],
+)
+async def test_only_missing_pages_are_remembered_after_navigation_fails(
+    failed_event_urls: TTLCache[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    goto_error: PlaywrightError | None,
+    response_status: int | None,
+    remembered: bool,
+) -> None:
+    monkeypatch.setattr(playwright_utils.asyncio, "sleep", AsyncMock())
+    page = _mock_page()
+    if goto_error is not None:
+        page.goto = AsyncMock(side_effect=goto_error)
+    else:
+        page.goto = AsyncMock(return_value=MagicMock(ok=False, status=response_status))
+    browser_context = _mock_browser_context()
+    browser_context.new_page = AsyncMock(return_value=page)
+    pool = PagePool(browser_context, size=1)
+
+    async def _get_event_details(page_wrapper: PageWrapper, event_url: str) -> Event:
+        await page_wrapper.navigate(event_url)
+        return _make_event(event_url)
+
+    events = await scrape_event_pages(MagicMock(spec=Browser), ["https://example.com/e"], _get_event_details, pool)
+
+    assert events == []
+    assert page.goto.await_count == 3
+    assert ("https://example.com/e" in failed_event_urls) is remembered
+
+
+async def test_page_pool_lends_out_at_most_size_pages_at_once() -> None:
+    browser_context = _mock_browser_context()
+    pool = PagePool(browser_context, size=2)
+    in_use = 0
+    most_in_use = 0
+
+    async def _borrow(url: str) -> None:
+        nonlocal in_use, most_in_use
+        async with pool.acquire(url):
+            in_use += 1
+            most_in_use = max(most_in_use, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+
+    await asyncio.gather(*(_borrow(f"https://example.com/{i}") for i in range(5)))
+
+    assert most_in_use == 2
+    assert browser_context.new_page.await_count == 2
+
+
+async def test_page_pool_reuses_idle_pages() -> None:
+    browser_context = _mock_browser_context()
+    pool = PagePool(browser_context, size=2)
+
+    async with pool.acquire("https://example.com/1") as first:
+        pass
+    async with pool.acquire("https://example.com/2") as second:
+        pass
+
+    assert second is first
+    browser_context.new_page.assert_awaited_once()
+
+
+async def test_page_pool_clears_cookies_when_the_host_changes() -> None:
+    browser_context = _mock_browser_context()
+    pool = PagePool(browser_context, size=2)
+
+    async with pool.acquire("https://a.example.com/1"):
+        pass
+    async with pool.acquire("https://a.example.com/2"):
+        pass
+    browser_context.clear_cookies.assert_not_awaited()
+
+    async with pool.acquire("https://b.example.com/1"):
+        pass
+    browser_context.clear_cookies.assert_awaited_once()
+
+
+async def test_page_pool_keeps_cookies_while_other_pages_are_in_use() -> None:
+    browser_context = _mock_browser_context()
+    pool = PagePool(browser_context, size=2)
+
+    async with pool.acquire("https://a.example.com/1"), pool.acquire("https://b.example.com/1"):
+        pass
+
+    browser_context.clear_cookies.assert_not_awaited()
+
+
+async def test_page_pool_resets_routing_of_returned_pages() -> None:
+    pool = PagePool(_mock_browser_context(), size=1)
+
+    async with pool.acquire("https://example.com/1") as page_wrapper:
+        page = cast(MagicMock, page_wrapper.page)
+
+    page.unroute_all.assert_awaited_once_with(behavior="ignoreErrors")
+
+
+async def test_page_pool_replaces_closed_pages() -> None:
+    browser_context = _mock_browser_context()
+    pool = PagePool(browser_context, size=1)
+
+    async with pool.acquire("https://example.com/1") as first:
+        first_page = cast(MagicMock, first.page)
+        first_page.is_closed.return_value = True
+    async with pool.acquire("https://example.com/2") as second:
+        pass
+
+    assert second is not first
+    first_page.unroute_all.assert_not_awaited()
+    assert browser_context.new_page.await_count == 2
+
+
+async def test_page_pool_replaces_pages_that_fail_to_reset() -> None:
+    browser_context = _mock_browser_context()
+    pool = PagePool(browser_context, size=1)
+
+    async with pool.acquire("https://example.com/1") as first:
+        first_page = cast(MagicMock, first.page)
+        first_page.unroute_all.side_effect = PlaywrightError("Target crashed")
+    async with pool.acquire("https://example.com/2") as second:
+        pass
+
+    assert second is not first
+    first_page.close.assert_awaited_once()
+    assert browser_context.new_page.await_count == 2
+
+
+@pytest.fixture
+def debug_browser(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> MagicMock:
+    """A browser whose contexts are mocks, with debug mode's trace recording turned on."""
+    debug_env = get_env().model_copy(update={"debug": True})
+    monkeypatch.setattr(playwright_utils, "get_env", lambda: debug_env)
+    monkeypatch.setattr(playwright_utils, "_TRACES_DIR", tmp_path)
+    browser_context = _mock_browser_context()
+    browser_context.tracing.start = AsyncMock()
+    browser_context.tracing.stop = AsyncMock()
+    browser_context.close = AsyncMock()
+    browser = MagicMock(spec=Browser)
+    browser.new_context = AsyncMock(return_value=browser_context)
+    return browser
+
+
+async def test_page_pool_records_no_trace_by_default(debug_browser: MagicMock) -> None:
+    async with PagePool.open(debug_browser, 1):
+        pass
+
+    debug_browser.new_context.return_value.tracing.start.assert_not_awaited()
+
+
+async def test_temporary_page_pool_records_trace_in_debug_mode(debug_browser: MagicMock) -> None:
+    async with ensure_page_pool(debug_browser):
+        pass
+
+    tracing = debug_browser.new_context.return_value.tracing
+    tracing.start.assert_awaited_once()
+    tracing.stop.assert_awaited_once()
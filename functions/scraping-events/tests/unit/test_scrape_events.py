@@ -0,0 +1,192 @@
+"""Unit tests for scrape result caching and event provider routing."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import Browser, BrowserContext, Page
+
+from scraping_events import caching, playwright_utils, scrape_events as scrape_events_module
+from scraping_events.caching import TTLCache
+from scraping_events.env import get_env
+from scraping_events.exceptions import PageTimeoutError, ParsingError, UnknownEventProviderError
+from scraping_events.playwright_utils import PagePool, PageWrapper, scrape_event_pages
+from scraping_events.schemas import Event
+from scraping_events.scrape_events import _find_event_provider, _parse_url, scrape_events
+
+
+def _make_event(url: str) -> Event:
+    return Event(
+        url=url,
+        title="Title",
+        description="",
+        time=datetime(2030, 1, 1, tzinfo=UTC),
+        venue_name=None,
+        venue_url=None,
+        venue_address=None,
+        image_url=None,
+    )
+
+
+class _FakeScraper:
+    """Stands in for the uncached scrape, recording each call and returning the events queued up for it."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+        self.results: list[list[Event]] = []
+
+    async def __call__(self, _browser: Browser, url: str, max_events: int, _page_pool: PagePool | None) -> list[Event]:
+        self.calls.append((url, max_events))
+        return self.results.pop(0) if self.results else [_make_event(url)]
+
+
+def _mock_page_pool() -> PagePool:
+    page = MagicMock(spec=Page)
+    page.is_closed.return_value = False
+    page.unroute_all = AsyncMock()
+    return PagePool(MagicMock(spec=BrowserContext, new_page=AsyncMock(return_value=page)), size=1)
+
+
+@pytest.fixture
+def fake_scraper(monkeypatch: pytest.MonkeyPatch) -> _FakeScraper:
+    scraper = _FakeScraper()
+    monkeypatch.setattr(scrape_events_module, "_scrape_events_uncached", scraper)
+    monkeypatch.setattr(scrape_events_module, "_SCRAPED_EVENTS_CACHE", TTLCache(ttl_s=3600))
+    return scraper
+
+
+@pytest.fixture
+def browser() -> Browser:
+    return MagicMock(spec=Browser)
+
+
+async def test_repeated_scrape_is_served_from_cache(fake_scraper: _FakeScraper, browser: Browser) -> None:
+    first = await scrape_events(browser, "https://example.com/events", 3)
+    second = await scrape_events(browser, "https://example.com/events", 3)
+
+    assert fake_scraper.calls == [("https://example.com/events", 3)]
+    assert second == first
+    # callers get their own list, so they can't alter the cached one
+    assert second is not first
+
+
+async def test_cache_is_keyed_on_url_and_max_events(fake_scraper: _FakeScraper, browser: Browser) -> None:
+    await scrape_events(browser, "https://example.com/events", 3)
+    await scrape_events(browser, "https://example.com/events", 5)
+    await scrape_events(browser, "https://example.com/other", 3)
+
+    assert fake_scraper.calls == [
+        ("https://example.com/events", 3),
+        ("https://example.com/events", 5),
+        ("https://example.com/other", 3),
+    ]
+
+
+async def test_empty_results_are_not_cached(fake_scraper: _FakeScraper, browser: Browser) -> None:
+    fake_scraper.results = [[]]
+
+    assert await scrape_events(browser, "https://example.com/events", 3) == []
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 1
+    assert len(fake_scraper.calls) == 2
+
+
+async def test_results_missing_failed_events_are_not_cached(
+    fake_scraper: _FakeScraper, browser: Browser, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    page_pool = _mock_page_pool()
+    event_urls = ["https://example.com/events/1", "https://example.com/events/2"]
+
+    async def _get_event_details(_page_wrapper: PageWrapper, event_url: str) -> Event:
+        # the second event's page times out the first time around
+        if event_url == event_urls[1] and len(fake_scraper.calls) == 1:
+            raise PageTimeoutError(event_url)
+        return _make_event(event_url)
+
+    async def _scrape(_browser: Browser, url: str, max_events: int, _page_pool: PagePool | None) -> list[Event]:
+        fake_scraper.calls.append((url, max_events))
+        return await scrape_event_pages(browser, event_urls, _get_event_details, page_pool)
+
+    monkeypatch.setattr(scrape_events_module, "_scrape_events_uncached", _scrape)
+
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 1
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 2
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 2
+    assert len(fake_scraper.calls) == 2
+
+
+async def test_results_missing_recently_failed_events_are_cached_until_those_are_retried(
+    fake_scraper: _FakeScraper, browser: Browser, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(caching.time, "monotonic", lambda: now[0])
+    failed_event_cache_ttl_s = get_env().failed_event_cache_ttl_s
+    monkeypatch.setattr(playwright_utils, "_FAILED_EVENT_URLS", TTLCache(ttl_s=failed_event_cache_ttl_s))
+    page_pool = _mock_page_pool()
+    event_urls = ["https://example.com/events/1", "https://example.com/events/2"]
+
+    async def _get_event_details(_page_wrapper: PageWrapper, event_url: str) -> Event:
+        # the second event's page is broken the first time around, so it's remembered as failed
+        if event_url == event_urls[1] and len(fake_scraper.calls) == 1:
+            raise ParsingError(f"Could not find event title for {event_url}")
+        return _make_event(event_url)
+
+    async def _scrape(_browser: Browser, url: str, max_events: int, _page_pool: PagePool | None) -> list[Event]:
+        fake_scraper.calls.append((url, max_events))
+        return await scrape_event_pages(browser, event_urls, _get_event_details, page_pool)
+
+    monkeypatch.setattr(scrape_events_module, "_scrape_events_uncached", _scrape)
+
+    # fails, so isn't cached
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 1
+    # skips the failed event, so is only cached until that's tried again
+    now[0] += 1
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 1
+    now[0] += 1
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 1
+    assert len(fake_scraper.calls) == 2
+
+    now[0] += failed_event_cache_ttl_s
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 2
+    now[0] += failed_event_cache_ttl_s
+    assert len(await scrape_events(browser, "https://example.com/events", 3)) == 2
+    assert len(fake_scraper.calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("url", "provider_name"),
+    [
+        ("https://www.meetup.com/some-group/", "Meetup.com"),
+        ("https://meetup.com/some-group/events/123/", "Meetup.com"),
+        ("https://lu.ma/some-event", "Luma Events"),
+        ("https://luma.com/some-calendar", "Luma Events"),
+        ("https://www.eventbrite.com/o/some-organizer-123", "Eventbrite"),
+        ("https://www.eventbrite.co.uk/e/some-event-123", "Eventbrite"),
+        ("https://cs.byu.edu/events/", "BYU CS Department"),
+        ("https://www.cs.utah.edu/events/", "University of Utah CS"),
+        ("https://kiln.utah.gov/events", "Misc Websites"),
+        ("https://www.wework.com/events/some-event", "Misc Websites"),
+    ],
+)
+def test_find_event_provider(url: str, provider_name: str) -> None:
+    event_provider = _find_event_provider(_parse_url(url))
+    assert event_provider is not None
+    assert event_provider.name == provider_name
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        # recognized hostname, but not a page its provider scrapes
+        "https://cs.byu.edu/about",
+        "https://example.com/events",
+        "not a url",
+    ],
+)
+def test_find_event_provider_unknown(url: str) -> None:
+    assert _find_event_provider(_parse_url(url)) is None
+
+
+async def test_scrape_events_rejects_unknown_provider(browser: Browser, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scrape_events_module, "_SCRAPED_EVENTS_CACHE", TTLCache(ttl_s=3600))
+    with pytest.raises(UnknownEventProviderError):
+        await scrape_events(browser, "https://example.com/events", 3)
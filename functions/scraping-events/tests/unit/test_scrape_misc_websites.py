@@ -0,0 +1,63 @@
+"""Unit tests for the misc website scraper's location filtering."""
+
+import pytest
+
+from scraping_events.scrape_misc_websites import _is_out_of_state, _is_utah_or_online
+
+
+@pytest.mark.parametrize(
+    "location_text",
+    [
+        "Salt Lake City, UT",
+        "Lehi, Utah",
+        "Provo, UT 84604",
+        "BYU Campus",
+        "Park City",
+        "Online Event",
+        "Virtual",
+        "Zoom",
+        "Microsoft Teams",
+    ],
+)
+def test_is_utah_or_online_accepts(location_text: str) -> None:
+    assert _is_utah_or_online(location_text)
+
+
+@pytest.mark.parametrize(
+    "location_text",
+    [
+        "Austin, TX",
+        "Teamsters Hall, Chicago, IL",
+        "Boston, MA",
+    ],
+)
+def test_is_utah_or_online_rejects(location_text: str) -> None:
+    assert not _is_utah_or_online(location_text)
+
+
+@pytest.mark.parametrize(
+    "location_text",
+    [
+        "Austin, TX",
+        "Austin, TX 78701",
+        "Denver, CO, USA",
+    ],
+)
+def test_is_out_of_state_accepts(location_text: str) -> None:
+    assert _is_out_of_state(location_text)
+
+
+@pytest.mark.parametrize(
+    "location_text",
+    [
+        # a bare town name isn't enough to rule Utah out
+        "Lehi",
+        "Draper",
+        "Salt Lake City, UT",
+        "Austin, TX or Online",
+        "Boulder, Colorado",
+        "Building IN, Room 4",
+    ],
+)
+def test_is_out_of_state_rejects(location_text: str) -> None:
+    assert not _is_out_of_state(location_text)